@@ -16,14 +16,51 @@ The module leverages requests.auth classes where possible.
 import os
 import json
 import time
+import hashlib
 import logging
+import tempfile
+import threading
+import http.cookiejar
+from concurrent.futures import ThreadPoolExecutor
+import xml.etree.ElementTree as ET
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase, HTTPBasicAuth
-from requests_oauthlib import OAuth1 as OAuth1Session
-from requests_oauthlib import OAuth2Session
-from oauthlib.oauth2 import BackendApplicationClient, LegacyApplicationClient
 import base64
-from typing import Dict, Optional, List, Any, Tuple, Union
+from urllib.parse import quote
+from typing import Dict, Optional, List, Any, Tuple, Union, Iterable, KeysView
+
+# Use orjson for parsing token responses and auth files when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize data to indented JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+# Use ijson to stream large JSON token responses when available
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# JSON responses larger than this are streamed instead of fully parsed
+_STREAM_JSON_THRESHOLD = 64 * 1024
+
+# Media type prefixes treated as XML in dynamic token/key responses
+_XML_CONTENT_TYPES = ('application/xml', 'text/xml')
+
+# Lowercases ASCII letters and turns spaces into underscores in a single pass
+_LABEL_XLAT = str.maketrans({**{c: c.lower() for c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'}, ' ': '_'})
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -31,12 +68,254 @@ logger = logging.getLogger(__name__)
 # Constants
 AUTH_CONFIG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config", "auth")
 
+# Per-user state such as cached OAuth2 tokens is kept outside the config tree,
+# so it is never listed or shown as an auth configuration
+STATE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "repl")
+OAUTH2_TOKEN_CACHE_PATH = os.path.join(STATE_DIR, "oauth2_tokens.json")
+# Marks that legacy auth files have been migrated to type-specific subdirectories
+MIGRATION_SENTINEL_PATH = os.path.join(AUTH_CONFIG_DIR, ".migrated_v1")
+
+# Maximum number of threads used to read auth files concurrently
+AUTH_LOAD_WORKERS = 16
+
+# Type-specific subdirectories of AUTH_CONFIG_DIR
+AUTH_TYPE_DIRS = ("basic", "bearer", "apikey", "oauth1", "oauth2")
+_AUTH_DIRS_ENSURED = False
+
 # Ensure auth config directory exists
 os.makedirs(AUTH_CONFIG_DIR, exist_ok=True)
 
+# Shared connection pool for dynamic token/key refreshes and OAuth2 token
+# requests, so repeated refreshes against the same auth endpoint reuse
+# pooled connections. Only the pool is shared: the cookie jar rejects every
+# cookie, so cookies set for one auth profile are never sent for another.
+_AUTH_SESSION = requests.Session()
+_AUTH_SESSION.cookies = requests.cookies.RequestsCookieJar(
+    policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+_AUTH_ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+_AUTH_SESSION.mount("https://", _AUTH_ADAPTER)
+_AUTH_SESSION.mount("http://", _AUTH_ADAPTER)
+
+
+def _ensure_auth_dirs() -> None:
+    """Create the auth config directory and its type subdirectories once per process"""
+    global _AUTH_DIRS_ENSURED
+    if _AUTH_DIRS_ENSURED:
+        return
+    for auth_type in AUTH_TYPE_DIRS:
+        os.makedirs(os.path.join(AUTH_CONFIG_DIR, auth_type), exist_ok=True)
+    _AUTH_DIRS_ENSURED = True
+
+
+def _write_json_atomic(file_path: str, data: Any) -> None:
+    """
+    Write JSON data to a file atomically
+    
+    The data is written to a temporary file in the same directory, which then
+    replaces the target, so readers never see a partially written file.
+    
+    Args:
+        file_path: Path to the file to write
+        data: JSON serializable data
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_json_dumps(data))
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _prepare_refresh_request(description: str, url: str, method: str, headers: Dict[str, str],
+                             body: Optional[str]) -> Optional[requests.PreparedRequest]:
+    """
+    Build the request used to refresh a dynamic token or API key
+    
+    Args:
+        description: Name of the value being refreshed, used in log messages
+        url: URL for value retrieval
+        method: HTTP method for value retrieval
+        headers: Headers for value retrieval
+        body: Request body for value retrieval
+        
+    Returns:
+        The prepared request, or None if it could not be built
+    """
+    if not url:
+        logger.warning("Cannot refresh %s: No authentication URL provided", description)
+        return None
+    
+    try:
+        return _AUTH_SESSION.prepare_request(requests.Request(
+            method=method,
+            url=url,
+            headers=headers,
+            data=body
+        ))
+    except Exception as e:
+        logger.error("Error refreshing %s: %s", description, e)
+        return None
+
+
+def _extract_json_value(response: requests.Response, path: Tuple[str, ...]) -> Any:
+    """
+    Extract the value at a pre-split dot notation path from a JSON response
+    
+    Large responses are streamed with ijson when it is installed, so only the
+    requested value is built instead of the whole document.
+    
+    Args:
+        response: The refresh response
+        path: The pre-split dot notation path
+        
+    Returns:
+        The value found at the path
+        
+    Raises:
+        KeyError, TypeError: If the path does not exist in the response
+    """
+    content_length = response.headers.get('Content-Length', '')
+    if IJSON_AVAILABLE and path and content_length.isdigit() and int(content_length) > _STREAM_JSON_THRESHOLD:
+        response.raw.decode_content = True
+        for value in ijson.items(response.raw, '.'.join(path), use_float=True):
+            return value
+        raise KeyError(path[-1])
+    
+    value = _json_loads(response.content)
+    for key in path:
+        value = value[key]
+    return value
+
+
+def _fetch_dynamic_value(description: str, request: requests.PreparedRequest,
+                         location: Optional[str], path: Tuple[str, ...]) -> Optional[Any]:
+    """
+    Send a prepared refresh request and extract the dynamic token or API key from the response
+    
+    Args:
+        description: Name of the value being refreshed, used in log messages
+        request: The prepared refresh request
+        location: Location of the value in the response (dot notation for JSON, XPath for XML)
+        path: The pre-split dot notation path for JSON responses
+        
+    Returns:
+        The extracted value, or None if the request or extraction failed
+    """
+    response = None
+    try:
+        # Session.send() skips the proxy/verify environment lookup that Session.request() does.
+        # The body is streamed when ijson is available so large JSON can be parsed incrementally.
+        settings = _AUTH_SESSION.merge_environment_settings(request.url, {}, IJSON_AVAILABLE or None, None, None)
+        response = _AUTH_SESSION.send(request, timeout=30, **settings)
+        
+        if not 200 <= response.status_code < 300:
+            logger.error("Failed to refresh %s: HTTP %s", description, response.status_code)
+            return None
+        
+        # Use entire response as the value
+        if not location:
+            return response.text
+        
+        # Only the media type is compared, by prefix, so parameters such as charset are ignored
+        content_type = response.headers.get('Content-Type', '').split(';', 1)[0].strip().lower()
+        # Handle JSON response
+        if content_type.startswith('application/json'):
+            # Navigate through nested JSON using dot notation
+            try:
+                value = _extract_json_value(response, path)
+            except (KeyError, TypeError):
+                logger.error("Location '%s' not found in %s response", location, description)
+                return None
+            return value
+        # Handle XML response
+        elif content_type.startswith(_XML_CONTENT_TYPES):
+            # Simple XML parsing - for complex XML, use a proper XML parser
+            root = ET.fromstring(response.text)
+            # Use XPath to find the value
+            elements = root.findall(location)
+            if elements:
+                return elements[0].text
+            logger.error("Location '%s' not found in %s XML response", location, description)
+            return None
+        
+        logger.error("Cannot extract %s: Unsupported content type '%s'", description, content_type)
+    except Exception as e:
+        logger.error("Error refreshing %s: %s", description, e)
+    finally:
+        if response is not None:
+            response.close()
+    return None
+
+
+def _is_auth_file(filename: str) -> bool:
+    """
+    Check whether a file name in the auth directory is an auth method file
+    
+    Dotfiles are internal state (e.g. the OAuth2 token cache or in-flight
+    temporary files), not auth methods.
+    """
+    return filename.endswith('.json') and not filename.startswith('.')
+
+
+def _label_to_filename(label: str) -> str:
+    """
+    Get the config file name for an auth method label
+    
+    Args:
+        label: The label of the authentication method
+        
+    Returns:
+        The file name used to store the authentication method
+    """
+    if label.isascii():
+        return f"{label.translate(_LABEL_XLAT)}.json"
+    # str.lower() also folds non-ASCII letters, which the table does not cover
+    return f"{label.lower().replace(' ', '_')}.json"
+
+
+def _file_mtime(file_path: str) -> Optional[int]:
+    """
+    Get the modification time of a file
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        The modification time in nanoseconds, or None if the file cannot be accessed
+    """
+    try:
+        return os.stat(file_path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _read_auth_file(file_path: str) -> Tuple[Optional[Dict[str, Any]], Optional[Exception]]:
+    """
+    Read and parse an auth method file
+    
+    Args:
+        file_path: Path to the auth JSON file
+        
+    Returns:
+        Tuple of (data, error), where exactly one of the two is None
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            return _json_loads(f.read()), None
+    except Exception as e:
+        return None, e
+
+
 class AuthMethod:
     """Base class for authentication methods"""
     
+    __slots__ = ('label', 'type', '_storage')
+    
     def __init__(self, label: str):
         """
         Initialize the authentication method
@@ -46,6 +325,22 @@ class AuthMethod:
         """
         self.label = label
         self.type = "base"  # Will be overridden by subclasses
+        self._storage = None
+    
+    def _storage_location(self) -> Tuple[str, str]:
+        """
+        Get the file name and type-specific directory used to store this method
+        
+        The result is cached and only recomputed if the label or type changes.
+        
+        Returns:
+            Tuple of (filename, type_dir)
+        """
+        storage = self._storage
+        if storage is None or storage[0] != self.label or storage[1] != self.type:
+            storage = self._storage = (self.label, self.type, _label_to_filename(self.label),
+                                       os.path.join(AUTH_CONFIG_DIR, self.type.lower()))
+        return storage[2], storage[3]
     
     def get_auth(self) -> Optional[AuthBase]:
         """
@@ -94,26 +389,33 @@ class AuthMethod:
         Returns:
             An AuthMethod instance
         """
-        auth_type = data.get("type", "")
-        
-        if auth_type == "basic":
-            return BasicAuth.from_dict(data)
-        elif auth_type == "bearer":
-            return BearerToken.from_dict(data)
-        elif auth_type == "apikey":
-            return ApiKey.from_dict(data)
-        elif auth_type == "oauth1":
-            return OAuth1.from_dict(data)
-        elif auth_type == "oauth2":
-            return OAuth2.from_dict(data)
-        else:
+        auth_class = AUTH_METHOD_TYPES.get(str(data.get("type", "")).lower())
+        
+        if auth_class is None:
             # Default fallback
             return cls(data.get("label", "Unknown"))
+        return auth_class.from_dict(data)
+
+
+class CachedHTTPBasicAuth(HTTPBasicAuth):
+    """HTTPBasicAuth that encodes the Authorization header once instead of per request"""
+    
+    def __init__(self, username: str, password: str):
+        super().__init__(username, password)
+        # Credentials are encoded as UTF-8, the same as apply_to_request has always done
+        auth_string = f"{username}:{password}"
+        self.header = "Basic " + base64.b64encode(auth_string.encode("utf-8")).decode("ascii")
+    
+    def __call__(self, r):
+        r.headers['Authorization'] = self.header
+        return r
 
 
 class BasicAuth(AuthMethod):
     """Basic Authentication method using requests.auth.HTTPBasicAuth"""
     
+    __slots__ = ('username', 'password', '_auth', '_auth_header')
+    
     def __init__(self, label: str, username: str, password: str):
         """
         Initialize Basic Authentication
@@ -127,7 +429,9 @@ class BasicAuth(AuthMethod):
         self.type = "basic"
         self.username = username
         self.password = password
-        self._auth = HTTPBasicAuth(username, password)
+        self._auth = CachedHTTPBasicAuth(username, password)
+        # The same header is used whether requests applies the auth or apply_to_request does
+        self._auth_header = self._auth.header
     
     def get_auth(self) -> HTTPBasicAuth:
         """Get the HTTPBasicAuth object for requests"""
@@ -136,19 +440,17 @@ class BasicAuth(AuthMethod):
     def apply_to_request(self, headers: Dict[str, str], params: Dict[str, str], cookies: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, str], Dict[str, str]]:
         """Apply Basic Authentication to the request headers"""
         # This is a fallback if not using the get_auth() method
-        auth_string = f"{self.username}:{self.password}"
-        encoded_auth = base64.b64encode(auth_string.encode()).decode()
-        headers["Authorization"] = f"Basic {encoded_auth}"
+        headers["Authorization"] = self._auth_header
         return headers, params, cookies
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
-        data = super().to_dict()
-        data.update({
+        return {
+            "label": self.label,
+            "type": self.type,
             "username": self.username,
             "password": self.password
-        })
-        return data
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'BasicAuth':
@@ -163,17 +465,22 @@ class BasicAuth(AuthMethod):
 class BearerTokenAuth(AuthBase):
     """Custom AuthBase implementation for Bearer Token authentication"""
     
-    def __init__(self, token: str):
+    def __init__(self, token: str, header: str = None):
         self.token = token
+        self.header = header or f"Bearer {token}"
     
     def __call__(self, r):
-        r.headers["Authorization"] = f"Bearer {self.token}"
+        r.headers["Authorization"] = self.header
         return r
 
 
 class BearerToken(AuthMethod):
     """Bearer Token Authentication method"""
     
+    __slots__ = ('token', 'is_dynamic', 'auth_url', 'auth_method', 'auth_headers', 'auth_body',
+                 'token_refresh_interval', 'token_location', 'last_refresh',
+                 '_auth_header', '_auth', '_token_path', '_expires_at')
+    
     def __init__(self, label: str, token: str = None, is_dynamic: bool = False,
                  auth_url: str = None, auth_method: str = "POST",
                  auth_headers: Dict[str, str] = None, auth_body: str = None,
@@ -195,6 +502,9 @@ class BearerToken(AuthMethod):
         super().__init__(label)
         self.type = "bearer"
         self.token = token
+        self._auth_header = f"Bearer {token}" if token else None
+        # Reused for every request until the token changes
+        self._auth = BearerTokenAuth(token, self._auth_header) if token else None
         self.is_dynamic = is_dynamic
         self.auth_url = auth_url
         self.auth_method = auth_method
@@ -202,86 +512,54 @@ class BearerToken(AuthMethod):
         self.auth_body = auth_body
         self.token_refresh_interval = token_refresh_interval
         self.token_location = token_location
+        # Pre-split the dot notation path so refreshes don't re-parse it
+        self._token_path = tuple(token_location.split('.')) if token_location else ()
         self.last_refresh = 0
+        self._expires_at = 0
     
     def get_auth(self) -> Optional[BearerTokenAuth]:
         """Get the BearerTokenAuth object for requests"""
         # For dynamic tokens, check if we need to refresh
-        if self.is_dynamic and (time.time() - self.last_refresh > self.token_refresh_interval):
+        if self.is_dynamic and time.time() >= self._expires_at:
             self._refresh_token()
         
-        if self.token:
-            return BearerTokenAuth(self.token)
-        return None
+        return self._auth
     
     def apply_to_request(self, headers: Dict[str, str], params: Dict[str, str], cookies: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, str], Dict[str, str]]:
         """Apply Bearer Token to the request headers"""
         # For dynamic tokens, check if we need to refresh
-        if self.is_dynamic and (time.time() - self.last_refresh > self.token_refresh_interval):
+        if self.is_dynamic and time.time() >= self._expires_at:
             self._refresh_token()
         
         if self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
+            headers["Authorization"] = self._auth_header
         
         return headers, params, cookies
     
     def _refresh_token(self) -> None:
         """Refresh the dynamic token"""
-        if not self.auth_url:
-            logger.warning("Cannot refresh token: No authentication URL provided")
+        # Prepared on every refresh, so edits to the auth settings are used
+        request = _prepare_refresh_request("token", self.auth_url, self.auth_method,
+                                           self.auth_headers, self.auth_body)
+        if request is None:
             return
         
-        try:
-            response = requests.request(
-                method=self.auth_method,
-                url=self.auth_url,
-                headers=self.auth_headers,
-                data=self.auth_body,
-                timeout=30
-            )
-            
-            if response.status_code >= 200 and response.status_code < 300:
-                # Extract token from response
-                if self.token_location:
-                    # Handle JSON response
-                    if response.headers.get('Content-Type', '').startswith('application/json'):
-                        json_data = response.json()
-                        # Navigate through nested JSON using dot notation
-                        token = json_data
-                        for key in self.token_location.split('.'):
-                            if key in token:
-                                token = token[key]
-                            else:
-                                logger.error(f"Token location '{self.token_location}' not found in response")
-                                return
-                        self.token = token
-                    # Handle XML response
-                    elif response.headers.get('Content-Type', '').startswith('application/xml') or response.headers.get('Content-Type', '').startswith('text/xml'):
-                        # Simple XML parsing - for complex XML, use a proper XML parser
-                        import xml.etree.ElementTree as ET
-                        root = ET.fromstring(response.text)
-                        # Use XPath to find the token
-                        elements = root.findall(self.token_location)
-                        if elements and len(elements) > 0:
-                            self.token = elements[0].text
-                        else:
-                            logger.error(f"Token location '{self.token_location}' not found in XML response")
-                            return
-                else:
-                    # Use entire response as token
-                    self.token = response.text
-                
-                self.last_refresh = time.time()
-                logger.info(f"Successfully refreshed bearer token for {self.label}")
-            else:
-                logger.error(f"Failed to refresh token: HTTP {response.status_code}")
-        except Exception as e:
-            logger.error(f"Error refreshing token: {str(e)}")
+        token = _fetch_dynamic_value("token", request, self.token_location, self._token_path)
+        if token is None:
+            return
+        
+        self.token = token
+        self._auth_header = f"Bearer {self.token}"
+        self._auth = BearerTokenAuth(self.token, self._auth_header)
+        self.last_refresh = time.time()
+        self._expires_at = self.last_refresh + self.token_refresh_interval
+        logger.info("Successfully refreshed bearer token for %s", self.label)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
-        data = super().to_dict()
-        data.update({
+        return {
+            "label": self.label,
+            "type": self.type,
             "token": self.token,
             "is_dynamic": self.is_dynamic,
             "auth_url": self.auth_url,
@@ -290,8 +568,7 @@ class BearerToken(AuthMethod):
             "auth_body": self.auth_body,
             "token_refresh_interval": self.token_refresh_interval,
             "token_location": self.token_location
-        })
-        return data
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'BearerToken':
@@ -316,29 +593,27 @@ class ApiKeyAuth(AuthBase):
         self.key = key
         self.param_name = param_name
         self.location = location.lower()
+        # Pre-encode the query parameter once instead of on every request
+        self._encoded_name = quote(str(param_name), safe='')
+        self._encoded_pair = f"{self._encoded_name}={quote(str(key), safe='')}"
     
     def __call__(self, r):
         if self.location == "header":
             r.headers[self.param_name] = self.key
         elif self.location == "query":
-            # Parse existing query parameters
-            url_parts = list(r.url.partition('?'))
-            params = {}
-            
-            if url_parts[1] and url_parts[2]:
-                for param in url_parts[2].split('&'):
-                    if '=' in param:
-                        k, v = param.split('=', 1)
-                        params[k] = v
+            url, hashmark, fragment = r.url.partition('#')
+            base, sep, query = url.partition('?')
             
-            # Add API key
-            params[self.param_name] = self.key
+            if not query:
+                r.url = f"{base}?{self._encoded_pair}{hashmark}{fragment}"
+                return r
             
-            # Rebuild query string
-            query_string = '&'.join([f"{k}={v}" for k, v in params.items()])
-            url_parts[1] = '?'
-            url_parts[2] = query_string
-            r.url = ''.join(url_parts)
+            # Replace any existing value for the parameter, keep the rest untouched
+            prefix = self._encoded_name + "="
+            params = [param for param in query.split('&')
+                      if param and param != self._encoded_name and not param.startswith(prefix)]
+            params.append(self._encoded_pair)
+            r.url = f"{base}?{'&'.join(params)}{hashmark}{fragment}"
         
         return r
 
@@ -346,6 +621,10 @@ class ApiKeyAuth(AuthBase):
 class ApiKey(AuthMethod):
     """API Key / Custom Token Authentication method"""
     
+    __slots__ = ('key', 'location', 'param_name', 'is_dynamic', 'auth_url', 'auth_method',
+                 'auth_headers', 'auth_body', 'key_refresh_interval', 'key_location',
+                 'last_refresh', '_key_path', '_expires_at', '_auth')
+    
     def __init__(self, label: str, key: str = None, location: str = "header",
                  param_name: str = "X-API-Key", is_dynamic: bool = False,
                  auth_url: str = None, auth_method: str = "POST",
@@ -379,22 +658,31 @@ class ApiKey(AuthMethod):
         self.auth_body = auth_body
         self.key_refresh_interval = key_refresh_interval
         self.key_location = key_location
+        # Pre-split the dot notation path so refreshes don't re-parse it
+        self._key_path = tuple(key_location.split('.')) if key_location else ()
         self.last_refresh = 0
+        self._expires_at = 0
+        self._update_auth()
+    
+    def _update_auth(self) -> None:
+        """Rebuild the ApiKeyAuth object, which is reused for every request until the key changes"""
+        if self.key and self.location != "cookie":  # Cookies need special handling
+            self._auth = ApiKeyAuth(self.key, self.param_name, self.location)
+        else:
+            self._auth = None
     
     def get_auth(self) -> Optional[ApiKeyAuth]:
         """Get the ApiKeyAuth object for requests"""
         # For dynamic keys, check if we need to refresh
-        if self.is_dynamic and (time.time() - self.last_refresh > self.key_refresh_interval):
+        if self.is_dynamic and time.time() >= self._expires_at:
             self._refresh_key()
         
-        if self.key and self.location != "cookie":  # Cookies need special handling
-            return ApiKeyAuth(self.key, self.param_name, self.location)
-        return None
+        return self._auth
     
     def apply_to_request(self, headers: Dict[str, str], params: Dict[str, str], cookies: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, str], Dict[str, str]]:
         """Apply API Key to the request based on location"""
         # For dynamic keys, check if we need to refresh
-        if self.is_dynamic and (time.time() - self.last_refresh > self.key_refresh_interval):
+        if self.is_dynamic and time.time() >= self._expires_at:
             self._refresh_key()
         
         if self.key:
@@ -409,61 +697,27 @@ class ApiKey(AuthMethod):
     
     def _refresh_key(self) -> None:
         """Refresh the dynamic API key"""
-        if not self.auth_url:
-            logger.warning("Cannot refresh API key: No authentication URL provided")
+        # Prepared on every refresh, like bearer token refreshes
+        request = _prepare_refresh_request("API key", self.auth_url, self.auth_method,
+                                           self.auth_headers, self.auth_body)
+        if request is None:
             return
         
-        try:
-            response = requests.request(
-                method=self.auth_method,
-                url=self.auth_url,
-                headers=self.auth_headers,
-                data=self.auth_body,
-                timeout=30
-            )
-            
-            if response.status_code >= 200 and response.status_code < 300:
-                # Extract key from response
-                if self.key_location:
-                    # Handle JSON response
-                    if response.headers.get('Content-Type', '').startswith('application/json'):
-                        json_data = response.json()
-                        # Navigate through nested JSON using dot notation
-                        key = json_data
-                        for k in self.key_location.split('.'):
-                            if k in key:
-                                key = key[k]
-                            else:
-                                logger.error(f"Key location '{self.key_location}' not found in response")
-                                return
-                        self.key = key
-                    # Handle XML response
-                    elif response.headers.get('Content-Type', '').startswith('application/xml') or response.headers.get('Content-Type', '').startswith('text/xml'):
-                        # Simple XML parsing - for complex XML, use a proper XML parser
-                        import xml.etree.ElementTree as ET
-                        root = ET.fromstring(response.text)
-                        # Use XPath to find the key
-                        elements = root.findall(self.key_location)
-                        if elements and len(elements) > 0:
-                            self.key = elements[0].text
-                        else:
-                            logger.error(f"Key location '{self.key_location}' not found in XML response")
-                            return
-                else:
-                    # Use entire response as key
-                    self.key = response.text
-                
-                self.last_refresh = time.time()
-                logger.info(f"Successfully refreshed API key for {self.label}")
-            else:
-                logger.error(f"Failed to refresh API key: HTTP {response.status_code}")
-        except Exception as e:
-            logger.error(f"Error refreshing API key: {str(e)}")
+        key = _fetch_dynamic_value("API key", request, self.key_location, self._key_path)
+        if key is None:
+            return
+        
+        self.key = key
+        self._update_auth()
+        self.last_refresh = time.time()
+        self._expires_at = self.last_refresh + self.key_refresh_interval
+        logger.info("Successfully refreshed API key for %s", self.label)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
-        data = super().to_dict()
-        data.update({
+        return {
+            "label": self.label,
+            "type": self.type,
             "key": self.key,
             "location": self.location,
             "param_name": self.param_name,
@@ -474,8 +728,7 @@ class ApiKey(AuthMethod):
             "auth_body": self.auth_body,
             "key_refresh_interval": self.key_refresh_interval,
             "key_location": self.key_location
-        })
-        return data
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ApiKey':
@@ -505,6 +758,8 @@ class OAuth1Auth(AuthBase):
         self.resource_owner_key = resource_owner_key
         self.resource_owner_secret = resource_owner_secret
         self.signature_method = signature_method
+        # Imported here so that non-OAuth users don't pay for loading oauthlib
+        from requests_oauthlib import OAuth1 as OAuth1Session
         self._auth = OAuth1Session(
             client_key=client_key,
             client_secret=client_secret,
@@ -521,6 +776,9 @@ class OAuth1Auth(AuthBase):
 class OAuth1(AuthMethod):
     """OAuth1 Authentication method"""
     
+    __slots__ = ('client_key', 'client_secret', 'resource_owner_key', 'resource_owner_secret',
+                 'signature_method', '_auth')
+    
     def __init__(self, label: str, client_key: str, client_secret: str, 
                  resource_owner_key: str = None, resource_owner_secret: str = None,
                  signature_method: str = 'HMAC-SHA1'):
@@ -542,16 +800,19 @@ class OAuth1(AuthMethod):
         self.resource_owner_key = resource_owner_key
         self.resource_owner_secret = resource_owner_secret
         self.signature_method = signature_method
+        # Signing parameters are fixed, so the auth object can be reused;
+        # a fresh nonce and timestamp are still generated per request
+        self._auth = OAuth1Auth(
+            client_key=client_key,
+            client_secret=client_secret,
+            resource_owner_key=resource_owner_key,
+            resource_owner_secret=resource_owner_secret,
+            signature_method=signature_method
+        )
     
     def get_auth(self) -> OAuth1Auth:
         """Get the OAuth1Auth object for requests"""
-        return OAuth1Auth(
-            client_key=self.client_key,
-            client_secret=self.client_secret,
-            resource_owner_key=self.resource_owner_key,
-            resource_owner_secret=self.resource_owner_secret,
-            signature_method=self.signature_method
-        )
+        return self._auth
     
     def apply_to_request(self, headers: Dict[str, str], params: Dict[str, str], cookies: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, str], Dict[str, str]]:
         """
@@ -565,15 +826,15 @@ class OAuth1(AuthMethod):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
-        data = super().to_dict()
-        data.update({
+        return {
+            "label": self.label,
+            "type": self.type,
             "client_key": self.client_key,
             "client_secret": self.client_secret,
             "resource_owner_key": self.resource_owner_key,
             "resource_owner_secret": self.resource_owner_secret,
             "signature_method": self.signature_method
-        })
-        return data
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'OAuth1':
@@ -588,20 +849,137 @@ class OAuth1(AuthMethod):
         )
 
 
+class OAuth2TokenCache:
+    """
+    Thread-safe cache of OAuth2 tokens persisted to disk
+    
+    Tokens are keyed by the settings that identify who they were issued to,
+    so a still-valid token is reused across AuthManager reloads and process
+    runs instead of calling the token endpoint again. The file is re-read
+    whenever its modification time changes, so processes running side by side
+    share the tokens each of them fetches.
+    """
+    
+    # Tokens expiring within this many seconds are not reused
+    EXPIRY_SKEW = 30
+    
+    def __init__(self, cache_path: str):
+        """
+        Initialize the token cache
+        
+        Args:
+            cache_path: Path to the JSON file used to persist the cache
+        """
+        self.cache_path = cache_path
+        self._tokens = None
+        self._mtime = None
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(token_url: str, client_id: str, scope: Union[List[str], str],
+                 grant_type: str, username: str = None) -> str:
+        """
+        Build the cache key for a set of OAuth2 settings
+        
+        Returns:
+            A hex digest identifying the token's issuer, client, scope, grant and user
+        """
+        scope_str = scope if isinstance(scope, str) else ",".join(sorted(scope or []))
+        raw = f"{token_url}|{client_id}|{scope_str}|{grant_type}|{username or ''}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached token that is still valid
+        
+        Args:
+            key: The cache key
+            
+        Returns:
+            The token dictionary, or None if there is no valid cached token
+        """
+        with self._lock:
+            self._load()
+            token = self._tokens.get(key)
+        
+        if token and token.get('expires_at', 0) - self.EXPIRY_SKEW > time.time():
+            return token
+        return None
+    
+    def set(self, key: str, token: Dict[str, Any]) -> None:
+        """
+        Store a token and persist the cache
+        
+        Tokens without an expiry time are not cached, since their validity is unknown.
+        
+        Args:
+            key: The cache key
+            token: The token dictionary
+        """
+        if not token.get('expires_at'):
+            return
+        
+        with self._lock:
+            self._load()
+            now = time.time()
+            # Drop expired entries while we're rewriting the file anyway
+            self._tokens = {k: v for k, v in self._tokens.items() if v.get('expires_at', 0) > now}
+            self._tokens[key] = dict(token)
+            try:
+                os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+                _write_json_atomic(self.cache_path, self._tokens)
+                self._mtime = _file_mtime(self.cache_path)
+            except Exception as e:
+                logger.warning("Could not persist OAuth2 token cache to %s: %s", self.cache_path, e)
+    
+    def _load(self) -> None:
+        """Load the persisted cache if it changed since it was last read (caller must hold the lock)"""
+        mtime = _file_mtime(self.cache_path)
+        if self._tokens is not None and mtime == self._mtime:
+            return
+        
+        self._mtime = mtime
+        if mtime is None:
+            # Keep tokens fetched in this process if the file is gone
+            if self._tokens is None:
+                self._tokens = {}
+            return
+        
+        try:
+            with open(self.cache_path, 'rb') as f:
+                data = _json_loads(f.read())
+        except FileNotFoundError:
+            data = {}
+        except Exception as e:
+            logger.warning("Ignoring unreadable OAuth2 token cache %s: %s", self.cache_path, e)
+            data = {}
+        self._tokens = data if isinstance(data, dict) else {}
+
+
+# Shared token cache for all OAuth2 methods
+oauth2_token_cache = OAuth2TokenCache(OAUTH2_TOKEN_CACHE_PATH)
+
+
 class OAuth2Auth(AuthBase):
     """Custom AuthBase implementation for OAuth2 authentication"""
     
-    def __init__(self, token: Dict[str, str]):
+    def __init__(self, token: Dict[str, str], header: str = None):
         self.token = token
+        self.header = header or f"Bearer {token.get('access_token', '')}"
     
     def __call__(self, r):
-        r.headers['Authorization'] = f"Bearer {self.token.get('access_token', '')}"
+        r.headers['Authorization'] = self.header
         return r
 
 
 class OAuth2(AuthMethod):
     """OAuth2 Authentication method"""
     
+    __slots__ = ('client_id', 'client_secret', 'token', 'token_url', 'refresh_url', 'scope',
+                 'grant_type', 'username', 'password', 'redirect_uri', 'auto_refresh_url',
+                 'auto_refresh_kwargs', 'token_updater', 'last_refresh', '_auth_header', '_auth', '_expiry',
+                 '_oauth_session', '_oauth_session_grant')
+    
     def __init__(self, label: str, client_id: str, client_secret: str, 
                  token: Dict[str, str] = None, token_url: str = None,
                  refresh_url: str = None, scope: List[str] = None,
@@ -644,40 +1022,77 @@ class OAuth2(AuthMethod):
         self.auto_refresh_kwargs = auto_refresh_kwargs or {}
         self.token_updater = token_updater
         self.last_refresh = time.time() if token else 0
+        self._oauth_session = None
+        self._oauth_session_grant = None
+        self._update_token_cache()
     
     def get_auth(self) -> Optional[OAuth2Auth]:
         """Get the OAuth2Auth object for requests"""
         # Check if we need to get/refresh the token
-        if not self.token or self._token_expired():
+        if self._token_expired():
             self._get_token()
         
-        if self.token and 'access_token' in self.token:
-            return OAuth2Auth(self.token)
-        return None
+        return self._auth
     
     def apply_to_request(self, headers: Dict[str, str], params: Dict[str, str], cookies: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, str], Dict[str, str]]:
         """Apply OAuth2 token to the request headers"""
         # Check if we need to get/refresh the token
-        if not self.token or self._token_expired():
+        if self._token_expired():
             self._get_token()
         
-        if self.token and 'access_token' in self.token:
-            headers["Authorization"] = f"Bearer {self.token['access_token']}"
+        if self._auth_header is not None:
+            headers["Authorization"] = self._auth_header
         
         return headers, params, cookies
     
     def _token_expired(self) -> bool:
         """Check if the token has expired"""
+        return time.time() >= self._expiry
+    
+    def _update_token_cache(self) -> None:
+        """Precompute the expiry time, Authorization header and auth object from the current token"""
         if not self.token:
-            return True
-        
-        expires_at = self.token.get('expires_at')
-        if expires_at:
+            self._expiry = 0
+        elif self.token.get('expires_at'):
             # Add a 10-second buffer to avoid edge cases
-            return time.time() > (expires_at - 10)
+            self._expiry = self.token['expires_at'] - 10
+        else:
+            # If no expires_at, expire an hour after the last refresh
+            self._expiry = self.last_refresh + 3600
+        
+        access_token = self.token.get('access_token') if self.token else None
+        if access_token is not None:
+            self._auth_header = f"Bearer {access_token}"
+            self._auth = OAuth2Auth(self.token, self._auth_header)
+        else:
+            self._auth_header = None
+            self._auth = None
+    
+    def _get_oauth_session(self, client_class: type = None) -> Any:
+        """
+        Get the OAuth2Session for the current grant type, creating it on first use
+        
+        Sessions use the module's shared adapter, so the connection to the token
+        endpoint stays pooled across refreshes and OAuth2 methods.
         
-        # If no expires_at, check if it's been more than an hour since last refresh
-        return (time.time() - self.last_refresh) > 3600
+        Args:
+            client_class: The oauthlib client class for the grant type, if any
+            
+        Returns:
+            The cached OAuth2Session
+        """
+        if self._oauth_session is None or self._oauth_session_grant != self.grant_type:
+            from requests_oauthlib import OAuth2Session
+            
+            if client_class:
+                session = OAuth2Session(client=client_class(client_id=self.client_id), scope=self.scope)
+            else:
+                session = OAuth2Session(client_id=self.client_id, scope=self.scope)
+            session.mount("https://", _AUTH_ADAPTER)
+            session.mount("http://", _AUTH_ADAPTER)
+            self._oauth_session = session
+            self._oauth_session_grant = self.grant_type
+        return self._oauth_session
     
     def _get_token(self) -> None:
         """Get or refresh the OAuth2 token"""
@@ -685,11 +1100,23 @@ class OAuth2(AuthMethod):
             logger.warning("Cannot get/refresh token: No token URL provided")
             return
         
+        cache_key = OAuth2TokenCache.make_key(self.token_url, self.client_id, self.scope,
+                                              self.grant_type, self.username)
+        cached_token = oauth2_token_cache.get(cache_key)
+        if cached_token:
+            self.token = cached_token
+            self.last_refresh = time.time()
+            self._update_token_cache()
+            logger.debug("Using cached OAuth2 token for %s", self.label)
+            return
+        
         try:
+            # Imported here so that non-OAuth users don't pay for loading oauthlib
+            from oauthlib.oauth2 import BackendApplicationClient, LegacyApplicationClient
+            
             if self.grant_type == 'client_credentials':
                 # Client credentials grant
-                client = BackendApplicationClient(client_id=self.client_id)
-                oauth = OAuth2Session(client=client, scope=self.scope)
+                oauth = self._get_oauth_session(BackendApplicationClient)
                 self.token = oauth.fetch_token(
                     token_url=self.token_url,
                     client_id=self.client_id,
@@ -702,8 +1129,7 @@ class OAuth2(AuthMethod):
                     logger.warning("Cannot get token: Username or password missing for password grant")
                     return
                 
-                client = LegacyApplicationClient(client_id=self.client_id)
-                oauth = OAuth2Session(client=client, scope=self.scope)
+                oauth = self._get_oauth_session(LegacyApplicationClient)
                 self.token = oauth.fetch_token(
                     token_url=self.token_url,
                     username=self.username,
@@ -718,7 +1144,7 @@ class OAuth2(AuthMethod):
                     logger.warning("Cannot refresh token: No refresh token available")
                     return
                 
-                oauth = OAuth2Session(client_id=self.client_id, scope=self.scope)
+                oauth = self._get_oauth_session()
                 self.token = oauth.refresh_token(
                     self.refresh_url or self.token_url,
                     refresh_token=self.token['refresh_token'],
@@ -727,7 +1153,7 @@ class OAuth2(AuthMethod):
                     scope=self.scope
                 )
             else:
-                logger.warning(f"Unsupported grant type: {self.grant_type}")
+                logger.warning("Unsupported grant type: %s", self.grant_type)
                 return
             
             # Update last refresh time
@@ -736,19 +1162,22 @@ class OAuth2(AuthMethod):
             # If token doesn't have expires_at, add it
             if 'expires_at' not in self.token and 'expires_in' in self.token:
                 self.token['expires_at'] = time.time() + self.token['expires_in']
+            self._update_token_cache()
+            oauth2_token_cache.set(cache_key, self.token)
             
             # Call token updater if provided
             if self.token_updater:
                 self.token_updater(self.token)
             
-            logger.info(f"Successfully obtained/refreshed OAuth2 token for {self.label}")
+            logger.info("Successfully obtained/refreshed OAuth2 token for %s", self.label)
         except Exception as e:
-            logger.error(f"Error getting/refreshing OAuth2 token: {str(e)}")
+            logger.error("Error getting/refreshing OAuth2 token: %s", e)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
-        data = super().to_dict()
-        data.update({
+        return {
+            "label": self.label,
+            "type": self.type,
             "client_id": self.client_id,
             "client_secret": self.client_secret,
             "token": self.token,
@@ -761,8 +1190,7 @@ class OAuth2(AuthMethod):
             "redirect_uri": self.redirect_uri,
             "auto_refresh_url": self.auto_refresh_url,
             "auto_refresh_kwargs": self.auto_refresh_kwargs
-        })
-        return data
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'OAuth2':
@@ -784,6 +1212,16 @@ class OAuth2(AuthMethod):
         )
 
 
+# Mapping of serialized auth type names to their AuthMethod classes
+AUTH_METHOD_TYPES = {
+    "basic": BasicAuth,
+    "bearer": BearerToken,
+    "apikey": ApiKey,
+    "oauth1": OAuth1,
+    "oauth2": OAuth2
+}
+
+
 class AuthManager:
     """Manager for authentication methods"""
     
@@ -791,33 +1229,41 @@ class AuthManager:
         """Initialize the authentication manager"""
         self.auth_methods = {}
         self.active_method = None
+        # File names of the auth method files by path; files are only parsed when needed
+        self._auth_index = {}
+        # Modification time of each file when it was loaded, and the label it held
+        self._loaded_files = {}
+        self._file_labels = {}
         self._migrate_auth_files()
-        self.load_auth_methods()
+        self._index_auth_files()
     
     def _migrate_auth_files(self) -> None:
         """
         Migrate existing auth files from the main directory to type-specific subdirectories
+        
+        Once a migration has completed without errors a sentinel file is written,
+        and later runs skip the scan entirely.
         """
-        if not os.path.exists(AUTH_CONFIG_DIR):
+        _ensure_auth_dirs()
+        if os.path.exists(MIGRATION_SENTINEL_PATH):
             return
         
-        # Create subdirectories if they don't exist
-        for auth_type in ["basic", "bearer", "apikey", "oauth1", "oauth2"]:
-            os.makedirs(os.path.join(AUTH_CONFIG_DIR, auth_type), exist_ok=True)
-        
         # Check for files in the main directory
-        for filename in os.listdir(AUTH_CONFIG_DIR):
-            if not filename.endswith('.json') or os.path.isdir(os.path.join(AUTH_CONFIG_DIR, filename)):
-                continue
-                
-            file_path = os.path.join(AUTH_CONFIG_DIR, filename)
+        with os.scandir(AUTH_CONFIG_DIR) as entries:
+            legacy_files = [entry for entry in entries
+                            if _is_auth_file(entry.name) and entry.is_file()]
+        
+        migration_failed = False
+        for entry in legacy_files:
+            filename = entry.name
+            file_path = entry.path
             try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
+                with open(file_path, 'rb') as f:
+                    data = _json_loads(f.read())
                     
                 # Skip if no type information
                 if "type" not in data:
-                    logger.warning(f"Skipping migration for {filename}: No type information")
+                    logger.warning("Skipping migration for %s: No type information", filename)
                     continue
                     
                 auth_type = data["type"].lower()
@@ -829,49 +1275,141 @@ class AuthManager:
                 # Move file to type-specific directory
                 new_path = os.path.join(type_dir, filename)
                 if not os.path.exists(new_path):
-                    import shutil
-                    shutil.copy2(file_path, new_path)
-                    logger.info(f"Migrated auth file: {filename} to {auth_type}/{filename}")
-                    
-                    # Remove original file after successful copy
-                    os.remove(file_path)
-                    logger.debug(f"Removed original auth file: {filename}")
+                    # Same filesystem, so this is a rename rather than a copy
+                    os.replace(file_path, new_path)
+                    logger.info("Migrated auth file: %s to %s/%s", filename, auth_type, filename)
             except Exception as e:
-                logger.error(f"Error migrating auth file {filename}: {str(e)}")
+                logger.error("Error migrating auth file %s: %s", filename, e)
+                migration_failed = True
+        
+        if not migration_failed:
+            try:
+                open(MIGRATION_SENTINEL_PATH, 'a').close()
+            except OSError as e:
+                logger.debug("Could not write auth migration sentinel: %s", e)
+    
+    def _index_auth_files(self) -> None:
+        """
+        Index auth method files by path without parsing them
+        
+        The index is rebuilt from scratch, and loaded files that are no longer
+        there are dropped along with the method they held.
+        """
+        self._auth_index.clear()
+        try:
+            with os.scandir(AUTH_CONFIG_DIR) as entries:
+                entries = list(entries)
+        except FileNotFoundError:
+            logger.debug("Auth config directory does not exist: %s", AUTH_CONFIG_DIR)
+            entries = []
+        
+        # Index the main directory first (legacy support) so that, as files are
+        # loaded in index order, methods in type-specific subdirectories take precedence
+        for entry in entries:
+            if _is_auth_file(entry.name) and entry.is_file():
+                self._auth_index[entry.path] = entry.name
+        
+        for entry in entries:
+            if entry.is_dir():
+                self._index_directory(entry.path)
+        
+        for file_path in [file_path for file_path in self._loaded_files if file_path not in self._auth_index]:
+            self._forget_file(file_path)
+            del self._loaded_files[file_path]
+    
+    def _index_directory(self, directory: str) -> None:
+        """
+        Index auth method files in a specific directory
+        
+        Args:
+            directory: Directory to index auth method files from
+        """
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if _is_auth_file(entry.name) and entry.is_file():
+                    self._auth_index[entry.path] = entry.name
     
     def load_auth_methods(self) -> None:
-        """Load authentication methods from config files"""
-        if not os.path.exists(AUTH_CONFIG_DIR):
-            logger.debug(f"Auth config directory does not exist: {AUTH_CONFIG_DIR}")
-            return
+        """Load all authentication methods from config files that are not loaded yet"""
+        self._index_auth_files()
+        self._load_files([file_path for file_path in self._auth_index
+                          if file_path not in self._loaded_files])
+    
+    def refresh_auth_methods(self) -> KeysView[str]:
+        """
+        Pick up auth method files that were added, changed or removed outside this manager
         
-        # Load auth methods from the main directory (legacy support)
-        self._load_from_directory(AUTH_CONFIG_DIR)
+        Only files whose modification time changed since they were loaded are parsed again.
+        The label a changed or removed file held is dropped first, so a method whose
+        label was edited does not linger under its old one.
         
-        # Load auth methods from type-specific subdirectories
-        for dirname in os.listdir(AUTH_CONFIG_DIR):
-            subdir_path = os.path.join(AUTH_CONFIG_DIR, dirname)
-            if os.path.isdir(subdir_path):
-                self._load_from_directory(subdir_path)
+        Returns:
+            A live view of the authentication method labels
+        """
+        self._index_auth_files()
+        
+        file_paths = []
+        for file_path, loaded_mtime in list(self._loaded_files.items()):
+            mtime = _file_mtime(file_path)
+            if mtime == loaded_mtime:
+                continue
+            self._forget_file(file_path)
+            if mtime is None:
+                del self._loaded_files[file_path]
+            else:
+                file_paths.append(file_path)
+        
+        # Files added since the last load are read along with the changed ones
+        file_paths.extend(file_path for file_path in self._auth_index
+                          if file_path not in self._loaded_files)
+        self._load_files(file_paths)
+        return self.auth_methods.keys()
+    
+    def _forget_file(self, file_path: str) -> None:
+        """
+        Drop the authentication method loaded from a file
+        
+        The method is kept if another loaded file holds the same label.
+        
+        Args:
+            file_path: Path of the auth JSON file
+        """
+        label = self._file_labels.pop(file_path, None)
+        if label is None or label in self._file_labels.values():
+            return
+        if self.auth_methods.pop(label, None) is not None:
+            logger.debug("Removed authentication method: %s (loaded from %s)", label, file_path)
     
-    def _load_from_directory(self, directory: str) -> None:
+    def _load_files(self, file_paths: Iterable[str]) -> None:
         """
-        Load authentication methods from a specific directory
+        Load authentication methods from a set of files
         
         Args:
-            directory: Directory to load auth methods from
-        """
-        for filename in os.listdir(directory):
-            if filename.endswith('.json'):
-                file_path = os.path.join(directory, filename)
-                try:
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)
-                        auth_method = AuthMethod.from_dict(data)
-                        self.auth_methods[auth_method.label] = auth_method
-                        logger.debug(f"Loaded authentication method: {auth_method.label} from {file_path}")
-                except Exception as e:
-                    logger.error(f"Error loading authentication method from {file_path}: {str(e)}")
+            file_paths: Paths of the auth JSON files to load
+        """
+        file_paths = list(file_paths)
+        # Taken before reading, so a write racing with the read is seen on the next refresh
+        for file_path in file_paths:
+            self._loaded_files[file_path] = _file_mtime(file_path)
+        
+        # Overlap file I/O when there are several files; results keep their order
+        # so later files still take precedence over earlier ones
+        if len(file_paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(AUTH_LOAD_WORKERS, len(file_paths))) as executor:
+                results = list(executor.map(_read_auth_file, file_paths))
+        else:
+            results = [_read_auth_file(file_path) for file_path in file_paths]
+        
+        for file_path, (data, error) in zip(file_paths, results):
+            try:
+                if error is not None:
+                    raise error
+                auth_method = AuthMethod.from_dict(data)
+                self.auth_methods[auth_method.label] = auth_method
+                self._file_labels[file_path] = auth_method.label
+                logger.debug("Loaded authentication method: %s from %s", auth_method.label, file_path)
+            except Exception as e:
+                logger.error("Error loading authentication method from %s: %s", file_path, e)
     
     def save_auth_method(self, auth_method: AuthMethod) -> bool:
         """
@@ -883,25 +1421,22 @@ class AuthManager:
         Returns:
             bool: True if successful, False otherwise
         """
-        if not os.path.exists(AUTH_CONFIG_DIR):
-            os.makedirs(AUTH_CONFIG_DIR, exist_ok=True)
-        
-        # Create type-specific subdirectory
-        auth_type = auth_method.type.lower()
-        type_dir = os.path.join(AUTH_CONFIG_DIR, auth_type)
-        os.makedirs(type_dir, exist_ok=True)
-        
-        # Create filename based on label
-        filename = f"{auth_method.label.lower().replace(' ', '_')}.json"
+        # Create type-specific subdirectory; the filename is based on the label
+        filename, type_dir = auth_method._storage_location()
+        _ensure_auth_dirs()
+        if auth_method.type.lower() not in AUTH_TYPE_DIRS:
+            os.makedirs(type_dir, exist_ok=True)
         file_path = os.path.join(type_dir, filename)
         
         try:
-            with open(file_path, 'w') as f:
-                json.dump(auth_method.to_dict(), f, indent=2)
-            logger.info(f"Saved authentication method to {file_path}")
+            _write_json_atomic(file_path, auth_method.to_dict())
+            self._auth_index[file_path] = filename
+            self._loaded_files[file_path] = _file_mtime(file_path)
+            self._file_labels[file_path] = auth_method.label
+            logger.info("Saved authentication method to %s", file_path)
             return True
         except Exception as e:
-            logger.error(f"Error saving authentication method to {file_path}: {str(e)}")
+            logger.error("Error saving authentication method to %s: %s", file_path, e)
             return False
     
     def delete_auth_method(self, label: str) -> bool:
@@ -914,34 +1449,31 @@ class AuthManager:
         Returns:
             bool: True if successful, False otherwise
         """
-        if label not in self.auth_methods:
-            logger.warning(f"Authentication method not found: {label}")
+        auth_method = self.get_auth_method(label)
+        if auth_method is None:
+            logger.warning("Authentication method not found: %s", label)
             return False
         
-        auth_method = self.auth_methods[label]
-        auth_type = auth_method.type.lower()
-        
-        # Check in type-specific directory first
-        type_dir = os.path.join(AUTH_CONFIG_DIR, auth_type)
-        filename = f"{label.lower().replace(' ', '_')}.json"
-        file_path = os.path.join(type_dir, filename)
-        
-        # If not found, check in main directory (legacy support)
-        if not os.path.exists(file_path):
-            file_path = os.path.join(AUTH_CONFIG_DIR, filename)
-        
-        if os.path.exists(file_path):
+        # Check in type-specific directory first, then in main directory (legacy support)
+        filename, type_dir = auth_method._storage_location()
+        for file_path in (os.path.join(type_dir, filename), os.path.join(AUTH_CONFIG_DIR, filename)):
             try:
                 os.remove(file_path)
-                del self.auth_methods[label]
-                logger.info(f"Deleted authentication method: {label}")
-                return True
+            except FileNotFoundError:
+                continue
             except Exception as e:
-                logger.error(f"Error deleting authentication method {label}: {str(e)}")
+                logger.error("Error deleting authentication method %s: %s", label, e)
                 return False
-        else:
-            logger.warning(f"Authentication method file not found: {file_path}")
-            return False
+            
+            del self.auth_methods[label]
+            self._loaded_files.pop(file_path, None)
+            self._file_labels.pop(file_path, None)
+            self._auth_index.pop(file_path, None)
+            logger.info("Deleted authentication method: %s", label)
+            return True
+        
+        logger.warning("Authentication method file not found: %s", file_path)
+        return False
     
     def set_active_method(self, label: str) -> bool:
         """
@@ -953,12 +1485,13 @@ class AuthManager:
         Returns:
             bool: True if successful, False otherwise
         """
-        if label not in self.auth_methods:
-            logger.warning(f"Authentication method not found: {label}")
+        auth_method = self.get_auth_method(label)
+        if auth_method is None:
+            logger.warning("Authentication method not found: %s", label)
             return False
         
-        self.active_method = self.auth_methods[label]
-        logger.info(f"Set active authentication method: {label}")
+        self.active_method = auth_method
+        logger.info("Set active authentication method: %s", label)
         return True
     
     def get_auth(self) -> Optional[AuthBase]:
@@ -990,14 +1523,16 @@ class AuthManager:
         
         return self.active_method.apply_to_request(headers, params, cookies)
     
-    def get_auth_methods(self) -> List[str]:
+    def get_auth_methods(self) -> KeysView[str]:
         """
-        Get a list of available authentication method labels
+        Get the available authentication method labels
         
         Returns:
-            List of authentication method labels
+            A live view of the authentication method labels
         """
-        return list(self.auth_methods.keys())
+        # Labels are only known once files are parsed
+        self.load_auth_methods()
+        return self.auth_methods.keys()
     
     def get_auth_method(self, label: str) -> Optional[AuthMethod]:
         """
@@ -1009,6 +1544,21 @@ class AuthManager:
         Returns:
             The authentication method, or None if not found
         """
+        auth_method = self.auth_methods.get(label)
+        if auth_method is not None:
+            return auth_method
+        
+        # Try the files named after the label before falling back to loading everything
+        filename = _label_to_filename(label)
+        file_paths = [file_path for file_path, name in self._auth_index.items()
+                      if name == filename and file_path not in self._loaded_files]
+        if file_paths:
+            self._load_files(file_paths)
+            auth_method = self.auth_methods.get(label)
+            if auth_method is not None:
+                return auth_method
+        
+        self.load_auth_methods()
         return self.auth_methods.get(label)
     
     def create_basic_auth(self, label: str, username: str, password: str) -> BasicAuth:
@@ -5,23 +5,47 @@ This module provides functionality for managing Postman collections.
 """
 
 import os
-import json
+import stat
+import sys
 import logging
 from typing import Dict, List, Optional, Set, Tuple, Any
 
+# Shared JSON file helpers; orjson is used for parsing collection files when available
+from modules.jsonfiles import load_json_file, read_json_file, dir_mtime as _dir_mtime, scan_directories
+
+# Use ijson to read collection IDs without parsing whole collections when available
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # Configure logger
 logger = logging.getLogger('repl.collections')
 
 # Constants
 SCRIPT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 COLLECTIONS_DIR = os.path.join(SCRIPT_DIR, "collections")
+_JSON = '.json'
+
+# Collection paths already found in the collections directory, by requested path
+_resolved_paths: Dict[str, str] = {}
+
+# Collection paths not found in the collections directory; only valid for the current index
+_unresolved_paths: Set[str] = set()
 
-# Import the config module directly
-from modules.config import validate_json_file
-config_available = True
+# Directory listings of the collections tree, shared by the listing and lookup functions
+_collections_index: Dict[str, Any] = {"root": None, "tree": None, "mtimes": None, "links": None}
 
+# Use the config module's validator when it is available
+try:
+    from modules.config import validate_json_file
+    config_available = True
+except ImportError:
+    config_available = False
+    
     # Define a simple validate_json_file function if the config module is not available
-def validate_json_file(file_path: str) -> Tuple[bool, Optional[Dict]]:
+    def validate_json_file(file_path: str) -> Tuple[bool, Optional[Dict]]:
         """
         Validate a JSON file and return its contents.
         
@@ -33,13 +57,142 @@ def validate_json_file(file_path: str) -> Tuple[bool, Optional[Dict]]:
                                         and the file contents if valid, None otherwise
         """
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = load_json_file(f)
             return True, data
         except Exception as e:
             logger.error(f"Error validating JSON file: {e}")
             return False, None
 
+def _probe(path: str) -> Optional[os.stat_result]:
+    """Stat a path with a single syscall, returning None if it cannot be accessed."""
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+def _is_file(path: str) -> bool:
+    """Check whether a path is an existing regular file (or a symlink to one)."""
+    st = _probe(path)
+    return st is not None and stat.S_ISREG(st.st_mode)
+
+def _scan_collections_tree(directory: str) -> Tuple[Dict[str, Tuple[List[str], List[str], List[str]]], Dict[str, Optional[int]], Set[str]]:
+    """
+    List every directory in a tree.
+    
+    Symlinked directories are followed, as the recursive listing used for display
+    always did, unless they lead back to a directory further up the same branch.
+    
+    Args:
+        directory: Root directory to scan
+        
+    Returns:
+        Tuple of the listing of each readable directory, as (subdirectory names, file names,
+        JSON file names) in listing order, the modification time of each directory that was
+        visited, and the paths of the symlinked directories
+    """
+    tree = {}
+    mtimes = {}
+    links = set()
+    for dir_path, mtime, entries in scan_directories(directory, follow_symlinks=True):
+        mtimes[dir_path] = mtime
+        if entries is None:
+            continue
+        
+        subdirs = []
+        files = []
+        for entry in entries:
+            if entry.is_dir():
+                subdirs.append(entry.name)
+                if entry.is_symlink():
+                    links.add(entry.path)
+            else:
+                files.append(entry.name)
+        # Filtered once here so listing and display code never re-checks suffixes
+        tree[dir_path] = (subdirs, files, [file for file in files if file.endswith(_JSON)])
+    
+    return tree, mtimes, links
+
+def _get_collections_tree() -> Dict[str, Tuple[List[str], List[str], List[str]]]:
+    """
+    Get the listing of every directory in the collections directory.
+    
+    The tree is scanned once and reused until a directory in it is modified, which
+    only takes a stat per directory instead of listing the whole tree again.
+    
+    Returns:
+        Dict[str, Tuple[List[str], List[str], List[str]]]: (subdirectory names, file names,
+        JSON file names) by directory path
+    """
+    index = _collections_index
+    if index["root"] == COLLECTIONS_DIR:
+        for dir_path, mtime in index["mtimes"].items():
+            if _dir_mtime(dir_path) != mtime:
+                break
+        else:
+            return index["tree"]
+    
+    tree, mtimes, links = _scan_collections_tree(COLLECTIONS_DIR)
+    # Anything could have appeared since the last scan
+    _unresolved_paths.clear()
+    index.update(root=COLLECTIONS_DIR, tree=tree, mtimes=mtimes, links=links)
+    return tree
+
+def _iter_collection_files():
+    """
+    Iterate over the JSON files in the collections directory tree, in the same order as os.walk.
+    
+    Like os.walk, symlinked directories are not descended into.
+    
+    Yields:
+        Tuple[str, str]: The file path and the path relative to the collections directory
+    """
+    tree = _get_collections_tree()
+    links = _collections_index["links"]
+    stack = [(COLLECTIONS_DIR, "")]
+    while stack:
+        dir_path, rel_prefix = stack.pop()
+        listing = tree.get(dir_path)
+        if listing is None:
+            continue
+        
+        # Child paths are built by concatenation rather than os.path.join per entry
+        subdirs, _, json_files = listing
+        path_prefix = os.path.join(dir_path, "")
+        for file in json_files:
+            yield path_prefix + file, rel_prefix + file
+        
+        # Pushed in reverse so subdirectories are visited in listing order
+        stack.extend((path_prefix + name, rel_prefix + name + os.sep)
+                     for name in reversed(subdirs) if path_prefix + name not in links)
+
+def _validated(file_path: str, st: Optional[os.stat_result] = None) -> Tuple[bool, Optional[Dict]]:
+    """
+    Validate a JSON file like validate_json_file, reusing the parsed contents
+    from the shared parsed-file cache while the file's modification time and
+    size are unchanged.
+    
+    The cached data is shared between callers, so it must not be modified.
+    
+    Args:
+        file_path: Path to the JSON file
+        st: Result of stat for the file, if the caller already has it
+        
+    Returns:
+        Tuple[bool, Optional[Dict]]: A tuple containing a boolean indicating if the file is valid,
+                                    and the file contents if valid, None otherwise
+    """
+    if st is None:
+        st = _probe(file_path)
+        if st is None:
+            return validate_json_file(file_path)
+    
+    try:
+        return True, read_json_file(file_path, st)
+    except Exception:
+        # Read the file again through the validator, which reports the error
+        return validate_json_file(file_path)
+
 def select_collection_file() -> str:
     """
     List all JSON collection files in the collections directory and allow the user to select one.
@@ -61,11 +214,7 @@ def select_collection_file() -> str:
     # Get all collection files recursively
     collection_files = []
     try:
-        for root, _, files in os.walk(COLLECTIONS_DIR):
-            for file in files:
-                if file.endswith('.json'):
-                    rel_path = os.path.relpath(os.path.join(root, file), COLLECTIONS_DIR)
-                    collection_files.append(rel_path)
+        collection_files = [rel_path for _, rel_path in _iter_collection_files()]
     except Exception as e:
         logger.error(f"Error listing collections directory: {e}")
         print(f"Error: Could not list collections directory: {e}")
@@ -94,9 +243,14 @@ def select_collection_file() -> str:
         print(f"{i}. {file}")
     print("0. Enter a different path")
     
+    # Messages don't change between attempts
+    num_files = len(collection_files)
+    prompt = f"\nSelect file (0-{num_files}): "
+    invalid_choice = f"Invalid choice. Enter a number between 0 and {num_files}."
+    
     while True:
         try:
-            choice = input("\nSelect file (0-{0}): ".format(len(collection_files)))
+            choice = input(prompt)
             choice_num = int(choice)
             
             if choice_num == 0:
@@ -106,12 +260,12 @@ def select_collection_file() -> str:
                     continue
                 return collection_path
             
-            if 1 <= choice_num <= len(collection_files):
+            if 1 <= choice_num <= num_files:
                 collection_path = os.path.join(COLLECTIONS_DIR, collection_files[choice_num-1])
                 logger.info(f"User selected collection file: {collection_files[choice_num-1]}")
                 return collection_path
             
-            print(f"Invalid choice. Enter a number between 0 and {len(collection_files)}.")
+            print(invalid_choice)
         except ValueError:
             print("Invalid input. Enter a number.")
 
@@ -126,52 +280,117 @@ def resolve_collection_path(collection_path: str) -> str:
     Returns:
         str: Resolved path to the collection file
     """
-    logger.debug(f"resolve_collection_path called with: {collection_path}")
-    logger.debug(f"Current working directory: {os.getcwd()}")
-    logger.debug(f"Collections directory: {COLLECTIONS_DIR}")
+    # An existing absolute path needs nothing more than a single stat
+    is_abs = bool(collection_path) and os.path.isabs(collection_path)
+    if is_abs and _is_file(collection_path):
+        return collection_path
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"resolve_collection_path called with: {collection_path}")
+        logger.debug(f"Current working directory: {os.getcwd()}")
+        logger.debug(f"Collections directory: {COLLECTIONS_DIR}")
     
     # If the path is empty, prompt the user to select a collection
     if not collection_path:
         return select_collection_file()
     
-    # Check if the path is absolute
-    if os.path.isabs(collection_path):
-        if os.path.exists(collection_path):
-            return collection_path
-        else:
-            logger.warning(f"Collection file not found at absolute path: {collection_path}")
+    # The remaining checks would only stat the same absolute path again
+    if is_abs:
+        logger.warning(f"Collection file not found at absolute path: {collection_path}")
+        return collection_path
     
     # Check if the file exists in the current directory
-    if os.path.exists(collection_path):
+    if _is_file(collection_path):
         return os.path.abspath(collection_path)
     
-    # Check if the file exists in the collections directory
+    # Reuse an earlier match in the collections directory, as long as the file is still there
+    resolved_path = _resolved_paths.get(collection_path)
+    if resolved_path is not None:
+        if _is_file(resolved_path):
+            return resolved_path
+        del _resolved_paths[collection_path]
+    
+    # Skip the search for paths that were not found before, unless the tree changed since
+    _get_collections_tree()
+    if collection_path not in _unresolved_paths:
+        resolved_path = _find_in_collections_dir(collection_path)
+        if resolved_path is not None:
+            _resolved_paths[collection_path] = resolved_path
+            return resolved_path
+        _unresolved_paths.add(collection_path)
+    
+    logger.warning(f"Collection file not found: {collection_path}")
+    return collection_path
+
+def _find_in_collections_dir(collection_path: str) -> Optional[str]:
+    """
+    Find a collection file in the collections directory or its subdirectories.
+    
+    Args:
+        collection_path: Path to the collection file, relative to the collections directory or a bare file name
+        
+    Returns:
+        Optional[str]: Path to the collection file if found, None otherwise
+    """
+    # Check if the file exists in the collections directory, as given or with a .json extension.
+    # This also covers every match on the path relative to the collections directory.
     collections_path = os.path.join(COLLECTIONS_DIR, collection_path)
-    if os.path.exists(collections_path):
-        return collections_path
+    for candidate in (collections_path, collections_path + _JSON):
+        if _is_file(candidate):
+            return candidate
     
-    # Check if the file exists in the collections directory with .json extension
-    if not collection_path.endswith('.json'):
-        collections_path_with_ext = os.path.join(COLLECTIONS_DIR, collection_path + '.json')
-        if os.path.exists(collections_path_with_ext):
-            return collections_path_with_ext
+    # Only a bare file name can match a file further down the tree
+    if os.sep in collection_path or (os.altsep and os.altsep in collection_path):
+        return None
     
     # Search recursively in the collections directory
     try:
-        for root, _, files in os.walk(COLLECTIONS_DIR):
-            for file in files:
-                if file == collection_path or file == collection_path + '.json':
-                    return os.path.join(root, file)
-                
-                # Check if the path is a relative path within the collections directory
-                rel_path = os.path.relpath(os.path.join(root, file), COLLECTIONS_DIR)
-                if rel_path == collection_path or rel_path == collection_path + '.json':
-                    return os.path.join(root, file)
+        return _find_first((collection_path, collection_path + _JSON))
     except Exception as e:
         logger.error(f"Error searching for collection file: {e}")
     
-    logger.warning(f"Collection file not found: {collection_path}")
-    return collection_path
+    return None
+
+def _find_first(names: Tuple[str, ...]) -> Optional[str]:
+    """
+    Find the first file in the collections directory tree with one of the given names.
+    
+    Directories are searched in the same order as os.walk, stopping at the first
+    match; like os.walk, symlinked directories are not descended into.
+    
+    Args:
+        names: File names to look for
+        
+    Returns:
+        Optional[str]: Path to the first matching file, None if there is none
+    """
+    tree = _get_collections_tree()
+    links = _collections_index["links"]
+    stack = [COLLECTIONS_DIR]
+    while stack:
+        dir_path = stack.pop()
+        listing = tree.get(dir_path)
+        if listing is None:
+            continue
+        
+        subdirs, files, _ = listing
+        path_prefix = os.path.join(dir_path, "")
+        for file in files:
+            if file in names:
+                return path_prefix + file
+        
+        # Pushed in reverse so subdirectories are visited in listing order
+        stack.extend(path_prefix + name for name in reversed(subdirs) if path_prefix + name not in links)
+    return None
+
+def invalidate_resolver_cache() -> None:
+    """Forget the collection paths remembered by resolve_collection_path."""
+    _resolved_paths.clear()
+    _unresolved_paths.clear()
+
+def invalidate_negative_cache() -> None:
+    """Forget the collection paths that resolve_collection_path could not find."""
+    _unresolved_paths.clear()
 
 def list_collections(format_type="tree"):
     """
@@ -192,142 +411,117 @@ def list_collections(format_type="tree"):
             return
     
     # Get all items in the collections directory
-    try:
-        items = os.listdir(COLLECTIONS_DIR)
-    except Exception as e:
-        logger.error(f"Could not list collections directory: {e}")
+    tree = _get_collections_tree()
+    if COLLECTIONS_DIR not in tree:
+        logger.error(f"Could not list collections directory: {COLLECTIONS_DIR}")
         return
     
-    if not items:
+    subdirs, files, _ = tree[COLLECTIONS_DIR]
+    if not subdirs and not files:
         print("No collection files or directories found.")
         print(f"Place your Postman collection JSON files in the {COLLECTIONS_DIR} directory.")
         return
     
     # Choose the appropriate display format
     if format_type.lower() == "tree":
-        _display_tree_format(items)
+        _display_tree_format(tree)
     else:
-        _display_table_format(items)
+        _display_table_format(tree)
 
-def _display_tree_format(items):
+def _display_tree_format(tree):
     """
     Display collections in a tree format with separation lines between main parent directories.
     
     Args:
-        items: List of items in the collections directory
+        tree: Directory listings of the collections tree
     """
-    print("\nAvailable collections:")
+    # Output is collected and written once instead of a print per line
+    lines = ["\nAvailable collections:"]
     
-    # First, handle files at the root level
-    root_files = []
-    for item in items:
-        item_path = os.path.join(COLLECTIONS_DIR, item)
-        if os.path.isfile(item_path) and item.endswith('.json'):
-            root_files.append(item)
+    dirs, _, root_files = tree[COLLECTIONS_DIR]
     
     # Print root files
     for file in sorted(root_files):
-        print(f"├── {file}")
+        lines.append(f"├── {file}")
     
     # Add a separation line if we have both root files and directories
-    dirs = [item for item in items if os.path.isdir(os.path.join(COLLECTIONS_DIR, item))]
     if root_files and dirs:
-        print("│")
+        lines.append("│")
     
     # Then process directories
     last_dir_index = len(dirs) - 1
+    path_prefix = os.path.join(COLLECTIONS_DIR, "")
     
     for i, dir_name in enumerate(sorted(dirs)):
         is_last = (i == last_dir_index)
         prefix = "└── " if is_last else "├── "
-        print(f"{prefix}{dir_name}/")
-        _print_directory_tree(os.path.join(COLLECTIONS_DIR, dir_name), "    " if is_last else "│   ")
+        lines.append(f"{prefix}{dir_name}/")
+        _format_directory_tree(tree, path_prefix + dir_name, "    " if is_last else "│   ", lines)
         
         # Add a separation line between main directories (except after the last one)
         if not is_last:
-            print("│")
+            lines.append("│")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def _print_directory_tree(directory_path, prefix):
+def _format_directory_tree(tree, directory_path, prefix, lines):
     """
-    Recursively print a directory tree.
+    Format a directory tree, depth first, using an explicit stack.
     
     Args:
+        tree: Directory listings of the collections tree
         directory_path: Path to the directory
         prefix: Prefix to use for indentation
+        lines: List to append the output lines to
     """
-    try:
-        items = os.listdir(directory_path)
-    except Exception as e:
-        logger.error(f"Could not list directory {directory_path}: {e}")
-        return
-    
-    # Separate directories and files
-    dirs = []
-    files = []
-    
-    for item in items:
-        item_path = os.path.join(directory_path, item)
-        if os.path.isdir(item_path):
-            dirs.append(item)
-        elif item.endswith('.json'):
-            files.append(item)
-    
-    # Sort both lists
-    dirs.sort()
-    files.sort()
-    
-    # Process files first
-    for i, file in enumerate(files):
-        is_last_file = (i == len(files) - 1) and not dirs
-        file_prefix = "└── " if is_last_file else "├── "
-        print(f"{prefix}{file_prefix}{file}")
-    
-    # Then process directories
-    for i, dir_name in enumerate(dirs):
-        is_last = (i == len(dirs) - 1)
-        dir_prefix = "└── " if is_last else "├── "
-        print(f"{prefix}{dir_prefix}{dir_name}/")
+    # Each entry is (line naming the directory, directory path, prefix for its contents)
+    stack = [(None, directory_path, prefix)]
+    while stack:
+        dir_line, directory_path, prefix = stack.pop()
+        if dir_line is not None:
+            lines.append(dir_line)
+        
+        listing = tree.get(directory_path)
+        if listing is None:
+            continue
+        
+        # Separate directories and files, and sort both lists
+        dirs = sorted(listing[0])
+        files = sorted(listing[2])
         
-        new_prefix = prefix + ("    " if is_last else "│   ")
-        _print_directory_tree(os.path.join(directory_path, dir_name), new_prefix)
+        # Process files first
+        for i, file in enumerate(files):
+            is_last_file = (i == len(files) - 1) and not dirs
+            file_prefix = "└── " if is_last_file else "├── "
+            lines.append(f"{prefix}{file_prefix}{file}")
+        
+        # Then process directories; pushed in reverse so they are printed in order
+        last_dir_index = len(dirs) - 1
+        path_prefix = os.path.join(directory_path, "")
+        for i in range(last_dir_index, -1, -1):
+            dir_name = dirs[i]
+            is_last = (i == last_dir_index)
+            dir_prefix = "└── " if is_last else "├── "
+            new_prefix = prefix + ("    " if is_last else "│   ")
+            stack.append((f"{prefix}{dir_prefix}{dir_name}/", path_prefix + dir_name, new_prefix))
 
-def _display_table_format(items):
+def _display_table_format(tree):
     """
     Display collections in a compact table format with separation lines between different parent directories.
     
     Args:
-        items: List of items in the collections directory
+        tree: Directory listings of the collections tree
     """
-    # Collect all files with their full directory path
-    collection_files = []
-    
-    # First, handle files at the root level
-    for item in items:
-        item_path = os.path.join(COLLECTIONS_DIR, item)
-        if os.path.isfile(item_path) and item.endswith('.json'):
-            collection_files.append(([], item))
-    
-    # Then recursively process directories
-    for item in items:
-        item_path = os.path.join(COLLECTIONS_DIR, item)
-        if os.path.isdir(item_path):
-            _collect_files_with_path(item_path, [item], collection_files)
-    
-    # Group files by their directory path
+    # Group files by their directory path, in a single pass over the tree
     grouped_files = {}
-    for path, filename in collection_files:
-        path_tuple = tuple(path)
-        if path_tuple not in grouped_files:
-            grouped_files[path_tuple] = []
-        grouped_files[path_tuple].append(filename)
+    for path, filename in _walk_json(tree):
+        grouped_files.setdefault(path, []).append(filename)
     
     # Determine the maximum depth of directories
-    max_depth = 0
-    for path in grouped_files.keys():
-        max_depth = max(max_depth, len(path))
+    max_depth = max(map(len, grouped_files), default=0)
     
-    # Print the table header
-    print("\nAvailable collections:")
+    # Print the table header; output is collected and written once instead of a print per line
+    lines = ["\nAvailable collections:"]
     
     # Create header columns based on max depth
     header_cols = []
@@ -335,17 +529,15 @@ def _display_table_format(items):
         header_cols.append(f"Directory {i+1}")
     header_cols.append("Files")
     
-    # Print header with less padding
-    header_format = ""
-    for _ in range(max_depth):
-        header_format += "{:<20} "
-    header_format += "{:<40}"
+    # Print header with less padding; rows use the same format
+    header_format = "{:<20} " * max_depth + "{:<40}"
+    format_row = header_format.format
     
-    print(header_format.format(*header_cols))
+    lines.append(format_row(*header_cols))
     
     # Create a separator line
     separator = "-" * (20 * max_depth + 40)
-    print(separator)
+    lines.append(separator)
     
     # Print the table rows
     current_parent = None
@@ -354,7 +546,7 @@ def _display_table_format(items):
         # Check if we're starting a new parent directory
         if path and (not current_parent or path[0] != current_parent):
             if current_parent:  # Add separator between different parent directories
-                print(separator)
+                lines.append(separator)
             current_parent = path[0] if path else None
         
         # Pad the path with empty strings if needed
@@ -363,44 +555,36 @@ def _display_table_format(items):
         # Join all files with commas
         files_str = ", ".join(sorted(files))
         
-        # Create the row format
-        row_format = ""
-        for _ in range(max_depth):
-            row_format += "{:<20} "
-        row_format += "{:<40}"
-        
         # Print the row
-        print(row_format.format(*(padded_path + [files_str])))
+        lines.append(format_row(*padded_path, files_str))
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def _collect_files_with_path(directory_path, current_path, collection_files):
+def _walk_json(tree):
     """
-    Helper function to collect files recursively with their full directory path.
+    Iterate over the JSON files in the collections tree with their directory path.
     
     Args:
-        directory_path: Path to the directory
-        current_path: List of directory names in the current path
-        collection_files: List to store the collected files
+        tree: Directory listings of the collections tree
+        
+    Yields:
+        Tuple[Tuple[str, ...], str]: The directory names leading to the file, and the file name
     """
-    try:
-        items = os.listdir(directory_path)
-    except Exception as e:
-        logger.error(f"Could not list directory {directory_path}: {e}")
-        return
-    
-    # Process files in this directory
-    for item in items:
-        item_path = os.path.join(directory_path, item)
-        if os.path.isfile(item_path) and item.endswith('.json'):
-            # Store as (path, filename)
-            collection_files.append((current_path, item))
-    
-    # Process subdirectories
-    for item in items:
-        item_path = os.path.join(directory_path, item)
-        if os.path.isdir(item_path):
-            # Create a new path by appending the current directory
-            new_path = current_path + [item]
-            _collect_files_with_path(item_path, new_path, collection_files)
+    stack = [(COLLECTIONS_DIR, ())]
+    while stack:
+        directory_path, current_path = stack.pop()
+        listing = tree.get(directory_path)
+        if listing is None:
+            continue
+        
+        dirs, _, json_files = listing
+        for item in json_files:
+            yield current_path, item
+        
+        # Pushed in reverse so subdirectories are visited in listing order
+        path_prefix = os.path.join(directory_path, "")
+        for item in reversed(dirs):
+            stack.append((path_prefix + item, current_path + (item,)))
 
 def load_collection(collection_path: str) -> Tuple[bool, Dict]:
     """
@@ -415,18 +599,16 @@ def load_collection(collection_path: str) -> Tuple[bool, Dict]:
     """
     logger.debug(f"load_collection called with path: {collection_path}")
     
-    # Resolve the collection path if it's not absolute
-    if not os.path.isabs(collection_path):
-        resolved_path = resolve_collection_path(collection_path)
-    else:
-        resolved_path = collection_path
+    # Existing absolute paths are returned by the resolver's fast path
+    resolved_path = resolve_collection_path(collection_path)
     
-    if not resolved_path or not os.path.exists(resolved_path):
+    st = _probe(resolved_path) if resolved_path else None
+    if st is None or not stat.S_ISREG(st.st_mode):
         logger.error(f"Collection file not found: {collection_path}")
         return False, {}
     
     # Validate and load the collection file
-    is_valid, collection_data = validate_json_file(resolved_path)
+    is_valid, collection_data = _validated(resolved_path, st)
     
     if not is_valid or not collection_data:
         logger.error(f"Invalid collection file: {resolved_path}")
@@ -447,18 +629,24 @@ def extract_collection_id(collection_path: str) -> Optional[str]:
     """
     logger.debug(f"extract_collection_id called with path: {collection_path}")
     
-    # Resolve the collection path if it's not absolute
-    if not os.path.isabs(collection_path):
-        resolved_path = resolve_collection_path(collection_path)
-    else:
-        resolved_path = collection_path
+    # Existing absolute paths are returned by the resolver's fast path
+    resolved_path = resolve_collection_path(collection_path)
     
-    if not resolved_path or not os.path.exists(resolved_path):
+    st = _probe(resolved_path) if resolved_path else None
+    if st is None or not stat.S_ISREG(st.st_mode):
         logger.error(f"Collection file not found: {collection_path}")
         return None
     
+    # The info block is normally at the start of the file, so stream just that far
+    if IJSON_AVAILABLE:
+        try:
+            return _stream_collection_id(resolved_path)
+        except Exception as e:
+            logger.error(f"Invalid collection file: {resolved_path}: {e}")
+            return None
+    
     # Validate the collection file
-    is_valid, collection_data = validate_json_file(resolved_path)
+    is_valid, collection_data = _validated(resolved_path, st)
     
     if not is_valid or not collection_data:
         logger.error(f"Invalid collection file: {resolved_path}")
@@ -468,4 +656,25 @@ def extract_collection_id(collection_path: str) -> Optional[str]:
     if "info" in collection_data and "_postman_id" in collection_data["info"]:
         return collection_data["info"]["_postman_id"]
     
-    return None 
\ No newline at end of file
+    return None 
+
+def _stream_collection_id(file_path: str) -> Optional[str]:
+    """
+    Read the collection ID from a Postman collection file with ijson.
+    
+    Parsing stops as soon as the ID is found or the info block ends, so only
+    the start of the file is read for a typical collection.
+    
+    Args:
+        file_path: Path to the collection file
+        
+    Returns:
+        Optional[str]: Collection ID if found, None otherwise
+    """
+    with open(file_path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == 'info._postman_id':
+                return value
+            if prefix == 'info' and event == 'end_map':
+                return None
+    return None
@@ -7,23 +7,37 @@ and other settings. It also includes functions for listing and showing configura
 """
 
 import os
+import sys
 import json
 import time
 import logging
 import socket
-import re
-from typing import Dict, List, Optional, Tuple, Any, Set
+import errno
+import selectors
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Any, Set, Iterable, Iterator
 
-# Try to import tabulate for better table formatting
-try:
-    from tabulate import tabulate
-    TABULATE_AVAILABLE = True
-except ImportError:
-    TABULATE_AVAILABLE = False
+# Check for tabulate for better table formatting; it is only imported when a table is
+# formatted, so commands that print no tables do not pay for the import
+TABULATE_AVAILABLE = importlib.util.find_spec("tabulate") is not None
+if not TABULATE_AVAILABLE:
     logger = logging.getLogger("repl.config")
     logger.warning("tabulate module not found. Tables will be displayed in simple format.")
     logger.warning("To install: pip install tabulate")
 
+# Shared JSON file helpers; orjson is used for reading and pretty-printing
+# configuration files when available
+from modules.jsonfiles import load_json_file as _json_load_file, read_json_file as _read_json_file
+from modules.jsonfiles import dir_mtime as _dir_mtime, scan_directories
+
+# Use ijson to summarize collections without building them in memory when available
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # Setup logging
 logger = logging.getLogger("repl.config")
 
@@ -35,6 +49,34 @@ AUTH_DIR = os.path.join(SCRIPT_DIR, "config", "auth")
 PROXY_DIR = os.path.join(SCRIPT_DIR, "config", "proxies")
 INSERTION_POINTS_DIR = os.path.join(SCRIPT_DIR, "insertion_points")
 COLLECTIONS_DIR = os.path.join(SCRIPT_DIR, "collections")
+_JSON = '.json'
+
+# JSON files under each configuration directory, with the modification time of every directory scanned
+_json_file_index: Dict[str, Tuple[List[str], Dict[str, Optional[int]]]] = {}
+
+# Maximum number of threads used to read files for the list commands
+LIST_WORKERS = 8
+
+# Proxy configurations returned by load_proxy by path, with the file's (mtime, size) when loaded
+_loaded_proxies: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
+
+# Configuration file paths by name for each directory, with the scan they were built from
+_config_name_indexes: Dict[str, Tuple[List[str], Dict[str, str]]] = {}
+
+# Maximum number of threads used to resolve proxy hostnames
+RESOLVE_WORKERS = 8
+
+# Fields shown by the auth list command
+_AUTH_LIST_FIELDS = ('type', 'username', 'token', 'key', 'in')
+
+# Fixed proxy settings, as written first by save_proxy and shown by the proxy list command,
+# and the template save_proxy writes them with
+_PROXY_KEYS = ('proxy_host', 'proxy_port', 'verify_ssl', 'target_insertion_point', 'verbose')
+_PROXY_TEMPLATE = (
+    '{\n    "proxy_host": %s,\n    "proxy_port": %s,\n    "verify_ssl": %s,'
+    '\n    "target_insertion_point": %s,\n    "verbose": %s'
+)
+_JSON_SCALAR_TYPES = (str, int, float, bool, type(None))
 
 # Default configuration
 DEFAULT_CONFIG = {
@@ -58,8 +100,8 @@ def validate_json_file(file_path: str) -> Tuple[bool, Optional[Dict]]:
                                     and the parsed JSON data if valid, None otherwise
     """
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            data = _json_load_file(f)
         return True, data
     except json.JSONDecodeError as e:
         logger.error(f"Invalid JSON in {file_path}: {e}")
@@ -69,6 +111,112 @@ def validate_json_file(file_path: str) -> Tuple[bool, Optional[Dict]]:
         return False, None
 
 
+def _find_json_files(base_dir: str) -> List[str]:
+    """
+    Find all JSON files recursively in a configuration directory, in the same order as os.walk.
+    
+    Hidden files and directories (such as the temporary files of atomic writes)
+    are skipped, since they are never configurations.
+    
+    The result is reused until a directory in the tree is modified, which only
+    takes a stat per directory instead of walking the whole tree again. The
+    returned list is shared between callers, so it must not be modified.
+    
+    Args:
+        base_dir: Directory to search
+        
+    Returns:
+        List[str]: Paths of the JSON files in the directory tree
+    """
+    cached = _json_file_index.get(base_dir)
+    if cached is not None:
+        files, mtimes = cached
+        if all(_dir_mtime(dir_path) == mtime for dir_path, mtime in mtimes.items()):
+            return files
+    
+    files = []
+    mtimes = {}
+    for dir_path, mtime, entries in scan_directories(base_dir, skip_hidden=True):
+        mtimes[dir_path] = mtime
+        if entries is not None:
+            files.extend(entry.path for entry in entries
+                         if entry.name.endswith(_JSON) and not entry.is_dir())
+    
+    _json_file_index[base_dir] = (files, mtimes)
+    return files
+
+
+def _ijson_error_message(error: Exception) -> str:
+    """Get the first line of an ijson parse error; the yajl backends report errors over several lines."""
+    message = str(error)
+    return message.splitlines()[0] if message else message
+
+
+def _read_json_fields(file_path: str, keys: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Read only the given top-level fields of a JSON object file.
+    
+    With ijson, only the requested values are built and reading stops once all
+    of them have been seen; otherwise the whole file is parsed.
+    
+    Args:
+        file_path: Path to the JSON file
+        keys: Names of the top-level fields to read
+        
+    Returns:
+        Dict[str, Any]: The requested fields that are present in the file
+    """
+    if not IJSON_AVAILABLE:
+        data = _read_json_file(file_path)
+        return {key: data[key] for key in keys if key in data}
+    
+    fields = {}
+    wanted = set(keys)
+    with open(file_path, 'rb') as f:
+        try:
+            for key, value in ijson.kvitems(f, '', use_float=True):
+                if key in wanted:
+                    fields[key] = value
+                    wanted.discard(key)
+                    if not wanted:
+                        break
+        except ijson.JSONError as e:
+            raise ValueError(_ijson_error_message(e)) from e
+    return fields
+
+
+def _iter_rows(build_row, paths: List[str]) -> Iterator[List[Any]]:
+    """
+    Build a table row for each file, reading the files concurrently.
+    
+    File reads release the GIL (as do the orjson and yajl parsers), so a small
+    thread pool overlaps the I/O of many files. Rows are yielded in the order of
+    paths as soon as each one and all those before it are ready, so printing can
+    start before the last file has been read.
+    
+    Args:
+        build_row: Function returning the table row for a file path
+        paths: Paths of the files to list
+        
+    Returns:
+        Iterator[List[Any]]: The rows, in the same order as paths
+    """
+    if len(paths) < 2:
+        yield from map(build_row, paths)
+        return
+    
+    with ThreadPoolExecutor(max_workers=min(LIST_WORKERS, len(paths))) as executor:
+        yield from executor.map(build_row, paths)
+
+
+def _copy_proxy(proxy: Dict) -> Dict:
+    """Copy a loaded proxy configuration, including its headers, so callers can modify it."""
+    proxy = dict(proxy)
+    if isinstance(proxy.get('headers'), dict):
+        proxy['headers'] = dict(proxy['headers'])
+    return proxy
+
+
 def load_proxy(proxy_path: str = None) -> Dict:
     """
     Load proxy configuration from a JSON file.
@@ -82,8 +230,6 @@ def load_proxy(proxy_path: str = None) -> Dict:
     """
     logger.debug(f"load_proxy called with proxy_path: {proxy_path}")
     
-    proxy = DEFAULT_CONFIG.copy()
-    
     # If no specific proxy path was provided, prompt user to select one
     if not proxy_path:
         proxy_path = select_proxy_file()
@@ -101,11 +247,24 @@ def load_proxy(proxy_path: str = None) -> Dict:
                 logger.warning(f"Could not create config/proxies directory: {e}")
                 return {}
         
-        if os.path.exists(proxy_file_path):
+        try:
+            st = os.stat(proxy_file_path)
+        except OSError:
+            st = None
+        
+        cached = _loaded_proxies.get(proxy_file_path) if st is not None else None
+        if cached is not None and cached[0] == (st.st_mtime_ns, st.st_size):
+            # Unchanged since it was last loaded; skip parsing it again
+            proxy = _copy_proxy(cached[1])
+            logger.debug(f"Reusing proxy loaded from {os.path.basename(proxy_file_path)}")
+        elif st is not None:
             # Validate the JSON file before loading
             is_valid, parsed_proxy = validate_json_file(proxy_file_path)
             
             if is_valid and parsed_proxy:
+                # Start from the defaults only once the file is known to be usable
+                proxy = {**DEFAULT_CONFIG}
+                
                 # Handle new proxy structure with nested 'proxy' object
                 if 'proxy' in parsed_proxy:
                     proxy_config = parsed_proxy['proxy']
@@ -139,12 +298,16 @@ def load_proxy(proxy_path: str = None) -> Dict:
                 proxy_dir = os.path.basename(os.path.dirname(proxy_file_path))
                 proxy_file = os.path.basename(proxy_file_path)
                 logger.info(f"Loaded proxy from {proxy_dir}/{proxy_file}")
+                
+                _loaded_proxies[proxy_file_path] = ((st.st_mtime_ns, st.st_size), proxy)
+                proxy = _copy_proxy(proxy)
             else:
                 logger.warning(f"Proxy file {os.path.basename(proxy_file_path)} is malformed, using default settings")
                 # Return empty dictionary to ensure we rely only on command-line arguments
                 return {}
         else:
             logger.info(f"No proxy file found at {os.path.basename(proxy_file_path)}, using default settings")
+            proxy = {**DEFAULT_CONFIG}
     except Exception as e:
         logger.error(f"Error loading proxy: {e}")
         # Return empty dictionary to ensure we rely only on command-line arguments
@@ -153,6 +316,31 @@ def load_proxy(proxy_path: str = None) -> Dict:
     return proxy
 
 
+def _dump_proxy(formatted_proxy: Dict[str, Any]) -> str:
+    """
+    Serialize a proxy configuration exactly as json.dumps(formatted_proxy, indent=4) would.
+    
+    The fixed settings are substituted into a template, so only the extra settings
+    (if any) go through the generic indenting encoder, which is pure Python.
+    
+    Args:
+        formatted_proxy: Proxy configuration, starting with the fixed settings in _PROXY_KEYS order
+        
+    Returns:
+        str: The JSON document
+    """
+    values = tuple(formatted_proxy[key] for key in _PROXY_KEYS)
+    if not all(isinstance(value, _JSON_SCALAR_TYPES) for value in values):
+        return json.dumps(formatted_proxy, indent=4)
+    
+    head = _PROXY_TEMPLATE % tuple(json.dumps(value) for value in values)
+    extras = {key: value for key, value in formatted_proxy.items() if key not in _PROXY_KEYS}
+    if not extras:
+        return head + "\n}"
+    # The extras' own document is already indented for this level; drop its opening brace
+    return head + ",\n" + json.dumps(extras, indent=4)[2:]
+
+
 def save_proxy(proxy: Dict) -> bool:
     """
     Save proxy configuration to a JSON file.
@@ -189,8 +377,10 @@ def save_proxy(proxy: Dict) -> bool:
             if key not in formatted_proxy and value is not None:
                 formatted_proxy[key] = value
         
+        # Serialize first so the file is written in one call rather than many small chunks
+        content = _dump_proxy(formatted_proxy)
         with open(CONFIG_FILE_PATH, 'w') as f:
-            json.dump(formatted_proxy, f, indent=4)
+            f.write(content)
         logger.info(f"Configuration saved to {os.path.basename(CONFIG_DIR)}/{os.path.basename(CONFIG_FILE_PATH)}")
         return True
     except Exception as e:
@@ -208,11 +398,8 @@ def select_proxy_file() -> str:
     logger.info("Listing available proxy files")
     
     # Get all JSON files in the config/proxies directory
-    proxy_profiles = []
     try:
-        for file in os.listdir(CONFIG_DIR):
-            if file.endswith('.json'):
-                proxy_profiles.append(file)
+        proxy_profiles = [file for file in os.listdir(CONFIG_DIR) if file.endswith(_JSON)]
     except Exception as e:
         logger.error(f"Error listing config/proxies directory: {e}")
         return CONFIG_FILE_PATH
@@ -255,7 +442,7 @@ def select_proxy_file() -> str:
             
             try:
                 with open(new_proxy_path, 'w') as f:
-                    json.dump(DEFAULT_CONFIG, f, indent=4)
+                    f.write(json.dumps(DEFAULT_CONFIG, indent=4))
                 logger.info(f"Created new proxy file: {new_proxy_file}")
                 print(f"\nCreated new proxy file: {new_proxy_file}")
                 return new_proxy_path
@@ -313,6 +500,108 @@ def check_proxy_connection(host: str, port: int) -> bool:
         return False
 
 
+def _resolve_host(host: str) -> Any:
+    """Resolve a hostname to an IPv4 address, returning the exception if it cannot be resolved."""
+    try:
+        address = socket.gethostbyname(host)
+    except Exception as e:
+        return e
+    logger.debug(f"Resolved {host} to IP: {address}")
+    return address
+
+
+def _resolve_hosts(hosts: List[str]) -> Dict[str, Any]:
+    """
+    Resolve several hostnames at once.
+    
+    Lookups block in the resolver without holding the GIL, so running them on a
+    small thread pool overlaps slow DNS queries instead of waiting on each in turn.
+    
+    Args:
+        hosts: Distinct hostnames to resolve
+        
+    Returns:
+        Dict[str, Any]: The IPv4 address, or the resolution error, for each hostname
+    """
+    if len(hosts) < 2:
+        return {host: _resolve_host(host) for host in hosts}
+    
+    with ThreadPoolExecutor(max_workers=min(RESOLVE_WORKERS, len(hosts))) as executor:
+        return dict(zip(hosts, executor.map(_resolve_host, hosts)))
+
+
+def check_proxy_connections(proxies: List[Tuple[str, int]], timeout: float = 2.0) -> Dict[Tuple[str, int], bool]:
+    """
+    Check several host and port pairs for a running proxy at the same time.
+    
+    Hostnames are resolved concurrently, then connections are started without
+    blocking and waited on together, so probing many proxies takes about as long
+    as the slowest one rather than the sum.
+    
+    Args:
+        proxies: (host, port) pairs to check
+        timeout: Seconds to wait for all connections
+        
+    Returns:
+        Dict[Tuple[str, int], bool]: Whether a proxy is running, for each (host, port) pair
+    """
+    results = {proxy: False for proxy in proxies}
+    addresses = _resolve_hosts(list(dict.fromkeys(host for host, _ in results)))
+    # On Windows a refused non-blocking connect is only reported in select()'s
+    # exception set. SelectSelector passes the write set as the exception set
+    # there and reports both as writable, so refused ports are seen straight
+    # away instead of after the timeout.
+    selector = selectors.SelectSelector() if sys.platform == "win32" else selectors.DefaultSelector()
+    
+    try:
+        for host, port in results:
+            address = addresses[host]
+            sock = None
+            try:
+                if isinstance(address, Exception):
+                    raise address
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.setblocking(False)
+                result = sock.connect_ex((address, port))
+            except Exception as e:
+                # Also covers ports that are out of range or not numbers
+                logger.debug(f"Error checking proxy at {host}:{port}: {str(e)}")
+                if sock is not None:
+                    sock.close()
+                continue
+            
+            if result in (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY):
+                selector.register(sock, selectors.EVENT_WRITE, (host, port))
+                continue
+            
+            sock.close()
+            results[(host, port)] = result == 0
+            logger.debug(f"Proxy connection {'successful' if result == 0 else 'failed'} at {host}:{port}")
+        
+        deadline = time.monotonic() + timeout
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for key, _ in selector.select(remaining):
+                host, port = key.data
+                result = key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                results[(host, port)] = result == 0
+                if result == 0:
+                    logger.debug(f"Proxy connection successful at {host}:{port}")
+                else:
+                    logger.debug(f"Proxy connection failed at {host}:{port} with error code {result}")
+                selector.unregister(key.fileobj)
+                key.fileobj.close()
+    finally:
+        # Connections still pending when the timeout expired
+        for key in list(selector.get_map().values()):
+            key.fileobj.close()
+        selector.close()
+    
+    return results
+
+
 def verify_proxy_with_request(host: str, port: int) -> bool:
     """
     Verify proxy by sending a test request.
@@ -348,7 +637,11 @@ def verify_proxy_with_request(host: str, port: int) -> bool:
         return False
 
 
-def truncate_string(s: str, max_length: int = 30) -> str:
+# Longest string shown in a table cell before it is truncated
+_CELL_WIDTH = 30
+
+
+def truncate_string(s: str, max_length: int = _CELL_WIDTH) -> str:
     """
     Truncate a string to a maximum length and add ellipsis if needed.
     
@@ -367,6 +660,54 @@ def truncate_string(s: str, max_length: int = 30) -> str:
     
     return s[:max_length-3] + "..."
 
+def _truncate_row(row: List[Any]) -> List[Any]:
+    """Truncate the long strings in a table row, only calling truncate_string for cells that need it."""
+    return [truncate_string(item) if isinstance(item, str) and len(item) > _CELL_WIDTH else item
+            for item in row]
+
+
+def _iter_table_lines(headers: List[str], data: Iterable[List[Any]]) -> Iterator[str]:
+    """
+    Generate the lines of a simple ASCII table, one row at a time.
+    
+    Args:
+        headers: List of column headers
+        data: Rows, where each row is a list of values
+        
+    Returns:
+        Iterator[str]: The table lines, without line endings
+    """
+    # Add header
+    header_str = " | ".join(headers)
+    yield header_str
+    yield "-" * len(header_str)
+    
+    # Add rows
+    for row in data:
+        # A list is joined faster than a generator, which join would turn into a list anyway
+        yield " | ".join([str(item) for item in _truncate_row(row)])
+
+
+def _import_tabulate():
+    """
+    Import tabulate when the first table is formatted.
+    
+    TABULATE_AVAILABLE only says that the package is installed; if importing it
+    fails, tables fall back to the simple format for the rest of the run.
+    
+    Returns:
+        The tabulate function, or None if it cannot be imported
+    """
+    global TABULATE_AVAILABLE
+    try:
+        from tabulate import tabulate
+    except ImportError as e:
+        TABULATE_AVAILABLE = False
+        logger.warning(f"Could not import tabulate ({e}). Tables will be displayed in simple format.")
+        return None
+    return tabulate
+
+
 def format_table(headers: List[str], data: List[List[Any]]) -> str:
     """
     Format data as a table.
@@ -378,34 +719,29 @@ def format_table(headers: List[str], data: List[List[Any]]) -> str:
     Returns:
         str: Formatted table as a string
     """
-    # Truncate long strings in data
-    processed_data = []
-    for row in data:
-        processed_row = []
-        for item in row:
-            if isinstance(item, str):
-                processed_row.append(truncate_string(item))
-            else:
-                processed_row.append(item)
-        processed_data.append(processed_row)
-    
-    if TABULATE_AVAILABLE:
-        return tabulate(processed_data, headers=headers, tablefmt="simple")
+    tabulate = _import_tabulate() if TABULATE_AVAILABLE else None
+    if tabulate is not None:
+        return tabulate([_truncate_row(row) for row in data], headers=headers, tablefmt="simple")
     else:
         # Simple ASCII table format if tabulate is not available
-        result = []
-        
-        # Add header
-        header_str = " | ".join(headers)
-        result.append(header_str)
-        result.append("-" * len(header_str))
-        
-        # Add rows
-        for row in processed_data:
-            row_str = " | ".join(str(item) for item in row)
-            result.append(row_str)
-            
-        return "\n".join(result)
+        return "\n".join(_iter_table_lines(headers, data))
+
+
+def print_table(headers: List[str], data: Iterable[List[Any]]) -> None:
+    """
+    Print data as a table.
+    
+    Without tabulate, lines are written to stdout as they are formatted rather
+    than being joined into one string first.
+    
+    Args:
+        headers: List of column headers
+        data: Rows, where each row is a list of values
+    """
+    if TABULATE_AVAILABLE and _import_tabulate() is not None:
+        print(format_table(headers, list(data)))
+    else:
+        sys.stdout.writelines(f"{line}\n" for line in _iter_table_lines(headers, data))
 
 
 def list_auth_configurations() -> None:
@@ -418,11 +754,7 @@ def list_auth_configurations() -> None:
         return
     
     # Find all JSON files recursively in the auth directory
-    auth_files = []
-    for root, _, files in os.walk(auth_dir):
-        for file in files:
-            if file.endswith('.json'):
-                auth_files.append(os.path.join(root, file))
+    auth_files = _find_json_files(auth_dir)
     
     if not auth_files:
         print("  No authentication configurations found.")
@@ -430,9 +762,8 @@ def list_auth_configurations() -> None:
     
     # Prepare data for table
     headers = ["Name", "Type", "Details"]
-    data = []
     
-    for auth_path in sorted(auth_files):
+    def build_row(auth_path: str) -> List[Any]:
         # Get relative path from auth directory for display
         rel_path = os.path.relpath(auth_path, auth_dir)
         # Use the filename without extension as the name
@@ -442,28 +773,29 @@ def list_auth_configurations() -> None:
             name = f"{os.path.dirname(rel_path)}/{name}"
         
         try:
-            with open(auth_path, 'r') as f:
-                auth_data = json.load(f)
-                auth_type = auth_data.get('type', 'Unknown')
-                
-                # Extract details based on auth type
-                details = ""
-                if auth_type == "basic":
-                    details = f"Username: {auth_data.get('username', 'N/A')}"
-                elif auth_type == "bearer":
-                    token = auth_data.get('token', '')
-                    if token and len(token) > 10:
-                        details = f"Token: {token[:5]}...{token[-5:]}"
-                    else:
-                        details = "Token: N/A"
-                elif auth_type == "apikey":
-                    details = f"Key: {auth_data.get('key', 'N/A')}, In: {auth_data.get('in', 'N/A')}"
-                
-                data.append([name, auth_type, details])
+            auth_data = _read_json_fields(auth_path, _AUTH_LIST_FIELDS)
+            auth_type = auth_data.get('type', 'Unknown')
+            
+            # Extract details based on auth type
+            details = ""
+            if auth_type == "basic":
+                details = f"Username: {auth_data.get('username', 'N/A')}"
+            elif auth_type == "bearer":
+                token = auth_data.get('token', '')
+                if token and len(token) > 10:
+                    details = f"Token: {token[:5]}...{token[-5:]}"
+                else:
+                    details = "Token: N/A"
+            elif auth_type == "apikey":
+                details = f"Key: {auth_data.get('key', 'N/A')}, In: {auth_data.get('in', 'N/A')}"
+            
+            return [name, auth_type, details]
         except Exception as e:
-            data.append([name, "Error", str(e)])
+            return [name, "Error", str(e)]
     
-    print(format_table(headers, data))
+    data = _iter_rows(build_row, sorted(auth_files))
+    
+    print_table(headers, data)
 
 
 def list_proxy_configurations() -> None:
@@ -476,11 +808,7 @@ def list_proxy_configurations() -> None:
         return
     
     # Find all JSON files recursively in the proxy directory
-    proxy_files = []
-    for root, _, files in os.walk(proxy_dir):
-        for file in files:
-            if file.endswith('.json'):
-                proxy_files.append(os.path.join(root, file))
+    proxy_files = _find_json_files(proxy_dir)
     
     if not proxy_files:
         print("  No proxy configurations found.")
@@ -488,9 +816,8 @@ def list_proxy_configurations() -> None:
     
     # Prepare data for table
     headers = ["Name", "Host", "Port", "SSL Verify", "Additional Settings"]
-    data = []
     
-    for proxy_path in sorted(proxy_files):
+    def build_row(proxy_path: str) -> List[Any]:
         # Get relative path from proxy directory for display
         rel_path = os.path.relpath(proxy_path, proxy_dir)
         # Use the filename without extension as the name
@@ -500,26 +827,27 @@ def list_proxy_configurations() -> None:
             name = f"{os.path.dirname(rel_path)}/{name}"
         
         try:
-            with open(proxy_path, 'r') as f:
-                proxy_data = json.load(f)
-                host = proxy_data.get('proxy_host', 'Unknown')
-                port = proxy_data.get('proxy_port', 'Unknown')
-                verify_ssl = "Yes" if proxy_data.get('verify_ssl', False) else "No"
-                
-                # Check for additional settings
-                additional = []
-                if 'target_insertion_point' in proxy_data and proxy_data['target_insertion_point']:
-                    additional.append(f"Insertion Point: {os.path.basename(proxy_data['target_insertion_point'])}")
-                if 'verbose' in proxy_data and proxy_data['verbose']:
-                    additional.append("Verbose Mode")
-                
-                additional_str = ", ".join(additional) if additional else "None"
-                
-                data.append([name, host, port, verify_ssl, additional_str])
+            proxy_data = _read_json_fields(proxy_path, _PROXY_KEYS)
+            host = proxy_data.get('proxy_host', 'Unknown')
+            port = proxy_data.get('proxy_port', 'Unknown')
+            verify_ssl = "Yes" if proxy_data.get('verify_ssl', False) else "No"
+            
+            # Check for additional settings
+            additional = []
+            if 'target_insertion_point' in proxy_data and proxy_data['target_insertion_point']:
+                additional.append(f"Insertion Point: {os.path.basename(proxy_data['target_insertion_point'])}")
+            if 'verbose' in proxy_data and proxy_data['verbose']:
+                additional.append("Verbose Mode")
+            
+            additional_str = ", ".join(additional) if additional else "None"
+            
+            return [name, host, port, verify_ssl, additional_str]
         except Exception as e:
-            data.append([name, "Error", "", "", str(e)])
+            return [name, "Error", "", "", str(e)]
+    
+    data = _iter_rows(build_row, sorted(proxy_files))
     
-    print(format_table(headers, data))
+    print_table(headers, data)
 
 
 def list_insertion_points() -> None:
@@ -532,11 +860,7 @@ def list_insertion_points() -> None:
         return
     
     # Find all JSON files recursively in the insertion points directory
-    insertion_files = []
-    for root, _, files in os.walk(insertion_dir):
-        for file in files:
-            if file.endswith('.json'):
-                insertion_files.append(os.path.join(root, file))
+    insertion_files = _find_json_files(insertion_dir)
     
     if not insertion_files:
         print("  No insertion points found.")
@@ -544,9 +868,8 @@ def list_insertion_points() -> None:
     
     # Prepare data for table
     headers = ["Name", "Variables", "Variable Names"]
-    data = []
     
-    for insertion_path in sorted(insertion_files):
+    def build_row(insertion_path: str) -> List[Any]:
         # Get relative path from insertion points directory for display
         rel_path = os.path.relpath(insertion_path, insertion_dir)
         # Use the filename without extension as the name
@@ -556,26 +879,27 @@ def list_insertion_points() -> None:
             name = f"{os.path.dirname(rel_path)}/{name}"
         
         try:
-            with open(insertion_path, 'r') as f:
-                insertion_data = json.load(f)
-                variables = insertion_data.get('variables', {})
-                var_count = len(variables)
-                
-                # Get variable names (limit to first 3 for display)
-                var_names = list(variables.keys())
-                if var_names:
-                    if len(var_names) > 3:
-                        var_names_str = f"{', '.join(var_names[:3])}... (+{len(var_names) - 3} more)"
-                    else:
-                        var_names_str = ", ".join(var_names)
+            insertion_data = _read_json_fields(insertion_path, ('variables',))
+            variables = insertion_data.get('variables', {})
+            var_count = len(variables)
+            
+            # Get variable names (limit to first 3 for display)
+            var_names = list(variables.keys())
+            if var_names:
+                if len(var_names) > 3:
+                    var_names_str = f"{', '.join(var_names[:3])}... (+{len(var_names) - 3} more)"
                 else:
-                    var_names_str = "None"
-                
-                data.append([name, var_count, var_names_str])
+                    var_names_str = ", ".join(var_names)
+            else:
+                var_names_str = "None"
+            
+            return [name, var_count, var_names_str]
         except Exception as e:
-            data.append([name, "Error", str(e)])
+            return [name, "Error", str(e)]
+    
+    data = _iter_rows(build_row, sorted(insertion_files))
     
-    print(format_table(headers, data))
+    print_table(headers, data)
 
 
 def list_workflows() -> None:
@@ -588,11 +912,7 @@ def list_workflows() -> None:
         return
     
     # Find all JSON files recursively in the collections directory
-    collection_files = []
-    for root, _, files in os.walk(collections_dir):
-        for file in files:
-            if file.endswith('.json'):
-                collection_files.append(os.path.join(root, file))
+    collection_files = _find_json_files(collections_dir)
     
     if not collection_files:
         print("  No workflows found.")
@@ -600,9 +920,8 @@ def list_workflows() -> None:
     
     # Prepare data for table
     headers = ["Name", "Collection Name", "Requests", "Description"]
-    data = []
     
-    for collection_path in sorted(collection_files):
+    def build_row(collection_path: str) -> List[Any]:
         # Get relative path from collections directory for display
         rel_path = os.path.relpath(collection_path, collections_dir)
         # Use the filename without extension as the name
@@ -612,20 +931,23 @@ def list_workflows() -> None:
             name = f"{os.path.dirname(rel_path)}/{name}"
         
         try:
-            with open(collection_path, 'r') as f:
-                collection_data = json.load(f)
+            if IJSON_AVAILABLE:
+                info, request_count = _summarize_collection_file(collection_path)
+            else:
+                collection_data = _read_json_file(collection_path)
                 info = collection_data.get('info', {})
-                collection_name = info.get('name', 'Unknown')
-                description = info.get('description', 'No description')
-                
-                # We'll truncate in the format_table function
                 request_count = count_requests_in_collection(collection_data)
-                
-                data.append([name, collection_name, request_count, description])
+            collection_name = info.get('name', 'Unknown')
+            description = info.get('description', 'No description')
+            
+            # We'll truncate in the format_table function
+            return [name, collection_name, request_count, description]
         except Exception as e:
-            data.append([name, "Error", "", str(e)])
+            return [name, "Error", "", str(e)]
+    
+    data = _iter_rows(build_row, sorted(collection_files))
     
-    print(format_table(headers, data))
+    print_table(headers, data)
 
 
 def count_requests_in_collection(collection_data: Dict[str, Any]) -> int:
@@ -639,20 +961,63 @@ def count_requests_in_collection(collection_data: Dict[str, Any]) -> int:
         int: The number of requests in the collection
     """
     count = 0
-    items = collection_data.get('item', [])
+    # Item lists still to visit; nested folders are pushed instead of recursed into
+    stack = [collection_data.get('item', [])]
     
-    def count_items(items_list: List[Dict[str, Any]]) -> None:
-        nonlocal count
-        for item in items_list:
+    while stack:
+        for item in stack.pop():
             if 'request' in item:
                 count += 1
             if 'item' in item:
-                count_items(item['item'])
+                stack.append(item['item'])
     
-    count_items(items)
     return count
 
 
+def _summarize_collection_file(file_path: str) -> Tuple[Dict[str, Any], int]:
+    """
+    Read a collection's name, description and request count in one ijson pass.
+    
+    Args:
+        file_path: Path to the collection file
+        
+    Returns:
+        Tuple[Dict[str, Any], int]: The collection's name and description (when present)
+                                    and the number of requests in the collection
+    """
+    info = {}
+    count = 0
+    builder = None
+    building = None
+    
+    with open(file_path, 'rb') as f:
+        try:
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if building is not None:
+                    # Rebuild a non-scalar name or description as the full parse would
+                    builder.event(event, value)
+                    if prefix == building and event in ('end_map', 'end_array'):
+                        info[building[5:]] = builder.value
+                        building = None
+                elif event == 'map_key':
+                    # Requests are items with a 'request' key, at any depth of nested 'item' lists
+                    if value == 'request':
+                        parts = prefix.split('.')
+                        if len(parts) % 2 == 0 and all(part == 'item' for part in parts):
+                            count += 1
+                elif prefix == 'info.name' or prefix == 'info.description':
+                    if event in ('start_map', 'start_array'):
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                        building = prefix
+                    else:
+                        info[prefix[5:]] = value
+        except ijson.JSONError as e:
+            raise ValueError(_ijson_error_message(e)) from e
+    
+    return info, count
+
+
 def handle_list_command(list_type: str) -> None:
     """
     Handle the --list command based on the specified type.
@@ -700,25 +1065,44 @@ def find_config_file(config_type: str, config_name: str) -> str:
     # Check if the config_name contains a directory path
     if "/" in config_name:
         # Try direct path first
-        direct_path = os.path.join(base_dir, config_name + ".json")
+        direct_path = os.path.join(base_dir, config_name + _JSON)
         if os.path.isfile(direct_path):
             return direct_path
     
     # Search recursively
-    for root, _, files in os.walk(base_dir):
-        for file in files:
-            if file.endswith('.json'):
-                # Check if the filename matches
-                if os.path.splitext(file)[0] == config_name:
-                    return os.path.join(root, file)
-                
-                # Check if the relative path matches
-                rel_path = os.path.relpath(os.path.join(root, file), base_dir)
-                rel_path_no_ext = os.path.splitext(rel_path)[0]
-                if rel_path_no_ext == config_name:
-                    return os.path.join(root, file)
+    return _config_name_index(base_dir).get(config_name, "")
+
+
+def _config_name_index(base_dir: str) -> Dict[str, str]:
+    """
+    Get the configuration files in a directory tree by name.
     
-    return ""
+    Each file is indexed under its filename and its relative path, both without
+    extension; when files share a name, the first one in os.walk order wins, as
+    a linear search would find it. The index is rebuilt whenever the directory
+    scan is.
+    
+    Args:
+        base_dir: Configuration directory
+        
+    Returns:
+        Dict[str, str]: Paths of the configuration files by name
+    """
+    files = _find_json_files(base_dir)
+    cached = _config_name_indexes.get(base_dir)
+    if cached is not None and cached[0] is files:
+        return cached[1]
+    
+    index = {}
+    for file_path in files:
+        # Index by the filename
+        index.setdefault(os.path.splitext(os.path.basename(file_path))[0], file_path)
+        # And by the relative path
+        rel_path = os.path.relpath(file_path, base_dir)
+        index.setdefault(os.path.splitext(rel_path)[0], file_path)
+    
+    _config_name_indexes[base_dir] = (files, index)
+    return index
 
 
 def show_auth_configuration(config_name: str) -> None:
@@ -734,10 +1118,9 @@ def show_auth_configuration(config_name: str) -> None:
         return
     
     try:
-        with open(config_path, 'r') as f:
-            config_data = json.load(f)
-            # Print raw JSON with indentation for readability
-            print(json.dumps(config_data, indent=2))
+        config_data = _read_json_file(config_path)
+        # Print raw JSON with indentation for readability
+        print(json.dumps(config_data, indent=2))
     except Exception as e:
         print(f"Error reading configuration file: {e}")
 
@@ -755,10 +1138,9 @@ def show_proxy_configuration(config_name: str) -> None:
         return
     
     try:
-        with open(config_path, 'r') as f:
-            config_data = json.load(f)
-            # Print raw JSON with indentation for readability
-            print(json.dumps(config_data, indent=2))
+        config_data = _read_json_file(config_path)
+        # Print raw JSON with indentation for readability
+        print(json.dumps(config_data, indent=2))
     except Exception as e:
         print(f"Error reading configuration file: {e}")
 
@@ -776,10 +1158,9 @@ def show_insertion_point(config_name: str) -> None:
         return
     
     try:
-        with open(config_path, 'r') as f:
-            config_data = json.load(f)
-            # Print raw JSON with indentation for readability
-            print(json.dumps(config_data, indent=2))
+        config_data = _read_json_file(config_path)
+        # Print raw JSON with indentation for readability
+        print(json.dumps(config_data, indent=2))
     except Exception as e:
         print(f"Error reading configuration file: {e}")
 
@@ -797,10 +1178,9 @@ def show_workflow(config_name: str) -> None:
         return
     
     try:
-        with open(config_path, 'r') as f:
-            config_data = json.load(f)
-            # Print raw JSON with indentation for readability
-            print(json.dumps(config_data, indent=2))
+        config_data = _read_json_file(config_path)
+        # Print raw JSON with indentation for readability
+        print(json.dumps(config_data, indent=2))
     except Exception as e:
         print(f"Error reading configuration file: {e}")
 
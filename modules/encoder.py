@@ -8,10 +8,57 @@ It's used when the insertion_point object includes an 'encoding' field.
 
 import urllib.parse
 import html
+import string
 import xml.sax.saxutils
 import json
 import base64
 
+
+class _EscapeTable(dict):
+    """
+    Translation table for str.translate that maps each code point to an escape sequence.
+    
+    Escapes for the first 256 code points are built up front; any others are
+    formatted the first time they are seen and kept for later calls. Characters
+    listed in unescaped map to themselves, and escapes overrides the template
+    for specific characters.
+    """
+    
+    def __init__(self, template, unescaped="", escapes=None):
+        super().__init__((i, template.format(i)) for i in range(256))
+        self.update((ord(char), char) for char in unescaped)
+        if escapes:
+            self.update((ord(char), escape) for char, escape in escapes.items())
+        self.template = template
+    
+    def __missing__(self, code_point):
+        escape = self[code_point] = self.template.format(code_point)
+        return escape
+
+
+# Escape tables for hex_escape, octal_escape and sql_char_encode (which strips the trailing comma)
+_HEX_TABLE = _EscapeTable("\\x{:02x}")
+_OCT_TABLE = _EscapeTable("\\{:03o}")
+_SQL_TABLE = _EscapeTable("{},")
+
+# Printable ASCII characters, which the JavaScript and CSS escapes leave alone
+_PRINTABLE_ASCII = "".join(map(chr, range(32, 127)))
+
+# Escape tables for unicode_escape, js_escape and css_escape
+_UNICODE_TABLE = _EscapeTable("\\u{:04x}", unescaped="".join(map(chr, range(128))))
+_JS_TABLE = _EscapeTable(
+    "\\u{:04x}",
+    unescaped=_PRINTABLE_ASCII,
+    escapes={"\n": "\\n", "\r": "\\r", "\t": "\\t", "\\": "\\\\", "\"": "\\\"", "'": "\\'"}
+)
+_CSS_TABLE = _EscapeTable("\\{:x} ", unescaped=_PRINTABLE_ASCII)
+
+# Characters that url_encode (urllib.parse.quote with its default safe "/") and js_escape
+# leave unchanged; values made only of these are returned as they are
+_URL_SAFE = frozenset(string.ascii_letters + string.digits + "_.-~/")
+_JS_SAFE = frozenset(_PRINTABLE_ASCII) - frozenset("\\\"'")
+
+
 class Encoder:
     """
     Encoder class that provides methods for encoding strings using various techniques.
@@ -32,33 +79,22 @@ class Encoder:
         """
         if not isinstance(value, str):
             value = str(value)
-            
-        encoding_functions = {
-            "url": Encoder.url_encode,
-            "double_url": Encoder.double_url_encode,
-            "html": Encoder.html_encode,
-            "xml": Encoder.xml_encode,
-            "unicode": Encoder.unicode_escape,
-            "hex": Encoder.hex_escape,
-            "octal": Encoder.octal_escape,
-            "base64": Encoder.base64_encode,
-            "sql_char": Encoder.sql_char_encode,
-            "js_escape": Encoder.js_escape,
-            "css_escape": Encoder.css_escape
-        }
         
-        if encoding_type not in encoding_functions:
+        encoding_function = Encoder._ENCODERS.get(encoding_type)
+        if encoding_function is None:
             raise ValueError(f"Unsupported encoding type: {encoding_type}")
         
         result = value
         for _ in range(iterations):
-            result = encoding_functions[encoding_type](result)
+            result = encoding_function(result)
         
         return result
     
     @staticmethod
     def url_encode(value):
         """URL encode a string"""
+        if _URL_SAFE.issuperset(value):
+            return value
         return urllib.parse.quote(value)
     
     @staticmethod
@@ -79,23 +115,17 @@ class Encoder:
     @staticmethod
     def unicode_escape(value):
         """Unicode escape a string"""
-        result = ""
-        for char in value:
-            if ord(char) > 127:
-                result += f"\\u{ord(char):04x}"
-            else:
-                result += char
-        return result
+        return value.translate(_UNICODE_TABLE)
     
     @staticmethod
     def hex_escape(value):
         """Hex escape a string"""
-        return ''.join(f"\\x{ord(char):02x}" for char in value)
+        return value.translate(_HEX_TABLE)
     
     @staticmethod
     def octal_escape(value):
         """Octal escape a string"""
-        return ''.join(f"\\{ord(char):03o}" for char in value)
+        return value.translate(_OCT_TABLE)
     
     @staticmethod
     def base64_encode(value):
@@ -105,34 +135,76 @@ class Encoder:
     @staticmethod
     def sql_char_encode(value):
         """SQL CHAR() function encoding"""
-        return f"CHAR({','.join(str(ord(char)) for char in value)})"
+        return f"CHAR({value.translate(_SQL_TABLE)[:-1]})"
     
     @staticmethod
     def js_escape(value):
         """JavaScript string escape"""
-        result = ""
-        for char in value:
-            if char in "\\\"'\n\r\t":
-                if char == "\n": result += "\\n"
-                elif char == "\r": result += "\\r"
-                elif char == "\t": result += "\\t"
-                else: result += "\\" + char
-            elif ord(char) < 32 or ord(char) > 126:
-                result += f"\\u{ord(char):04x}"
-            else:
-                result += char
-        return result
+        if _JS_SAFE.issuperset(value):
+            return value
+        return value.translate(_JS_TABLE)
     
     @staticmethod
     def css_escape(value):
         """CSS escape sequences"""
-        result = ""
-        for char in value:
-            if ord(char) < 32 or ord(char) > 126:
-                result += f"\\{ord(char):x} "
-            else:
-                result += char
-        return result
+        return value.translate(_CSS_TABLE)
+
+
+# Encoding functions by encoding type, built once rather than on every encode call
+Encoder._ENCODERS = {
+    "url": Encoder.url_encode,
+    "double_url": Encoder.double_url_encode,
+    "html": Encoder.html_encode,
+    "xml": Encoder.xml_encode,
+    "unicode": Encoder.unicode_escape,
+    "hex": Encoder.hex_escape,
+    "octal": Encoder.octal_escape,
+    "base64": Encoder.base64_encode,
+    "sql_char": Encoder.sql_char_encode,
+    "js_escape": Encoder.js_escape,
+    "css_escape": Encoder.css_escape
+}
+
+
+def _encode_variables(variables):
+    """
+    Apply the encodings specified on a list of variables, in place.
+    
+    Args:
+        variables (list): Variable dicts, from either an insertion point or a Postman environment
+    """
+    for variable in variables:
+        # Skip base_url as it should never be encoded
+        if variable.get("key") == "base_url":
+            # Remove any encoding info from base_url to prevent encoding
+            if "encoding" in variable:
+                del variable["encoding"]
+            if "encoding_iterations" in variable:
+                del variable["encoding_iterations"]
+            continue
+            
+        if "encoding" in variable:
+            encoding_type = variable["encoding"]
+            iterations = variable.get("encoding_iterations", 1)
+            
+            if isinstance(iterations, str) and iterations.isdigit():
+                iterations = int(iterations)
+            
+            if not isinstance(iterations, int) or iterations < 1:
+                iterations = 1
+            
+            try:
+                variable["value"] = Encoder.encode(
+                    variable["value"], 
+                    encoding_type, 
+                    iterations
+                )
+                # Remove encoding info to prevent double encoding
+                del variable["encoding"]
+                if "encoding_iterations" in variable:
+                    del variable["encoding_iterations"]
+            except ValueError as e:
+                print(f"Warning: {e}")
 
 
 def process_insertion_point(insertion_point):
@@ -144,82 +216,41 @@ def process_insertion_point(insertion_point):
         
     Returns:
         dict: The processed insertion point with encoded values
+        
+    Raises:
+        TypeError: If the variables are not a list of objects
     """
     if not isinstance(insertion_point, dict):
         return insertion_point
     
-    # Deep copy to avoid modifying the original
-    result = json.loads(json.dumps(insertion_point))
-    
-    # Process variables if they exist
+    # Copy only what gets modified (variables with encoding info) to avoid modifying the
+    # original; everything else is shared with the input rather than round-tripped through JSON
+    result = dict(insertion_point)
     if "variables" in result:
-        for i, variable in enumerate(result["variables"]):
-            # Skip base_url as it should never be encoded
-            if variable.get("key") == "base_url":
-                # Remove any encoding info from base_url to prevent encoding
-                if "encoding" in result["variables"][i]:
-                    del result["variables"][i]["encoding"]
-                if "encoding_iterations" in result["variables"][i]:
-                    del result["variables"][i]["encoding_iterations"]
-                continue
-                
-            if "encoding" in variable:
-                encoding_type = variable["encoding"]
-                iterations = variable.get("encoding_iterations", 1)
-                
-                if isinstance(iterations, str) and iterations.isdigit():
-                    iterations = int(iterations)
-                
-                if not isinstance(iterations, int) or iterations < 1:
-                    iterations = 1
-                
-                try:
-                    result["variables"][i]["value"] = Encoder.encode(
-                        variable["value"], 
-                        encoding_type, 
-                        iterations
-                    )
-                    # Remove encoding info to prevent double encoding
-                    del result["variables"][i]["encoding"]
-                    if "encoding_iterations" in result["variables"][i]:
-                        del result["variables"][i]["encoding_iterations"]
-                except ValueError as e:
-                    print(f"Warning: {e}")
-    
-    # Handle Postman environment format (with values array)
+        list_key = "variables"
+        if not isinstance(result["variables"], list):
+            raise TypeError(f"Insertion point variables must be a list, not {type(result['variables']).__name__}")
     elif "values" in result and isinstance(result["values"], list):
-        for i, variable in enumerate(result["values"]):
-            # Skip base_url as it should never be encoded
-            if variable.get("key") == "base_url":
-                # Remove any encoding info from base_url to prevent encoding
-                if "encoding" in result["values"][i]:
-                    del result["values"][i]["encoding"]
-                if "encoding_iterations" in result["values"][i]:
-                    del result["values"][i]["encoding_iterations"]
-                continue
-                
-            if "encoding" in variable:
-                encoding_type = variable["encoding"]
-                iterations = variable.get("encoding_iterations", 1)
-                
-                if isinstance(iterations, str) and iterations.isdigit():
-                    iterations = int(iterations)
-                
-                if not isinstance(iterations, int) or iterations < 1:
-                    iterations = 1
-                
-                try:
-                    result["values"][i]["value"] = Encoder.encode(
-                        variable["value"], 
-                        encoding_type, 
-                        iterations
-                    )
-                    # Remove encoding info to prevent double encoding
-                    del result["values"][i]["encoding"]
-                    if "encoding_iterations" in result["values"][i]:
-                        del result["values"][i]["encoding_iterations"]
-                except ValueError as e:
-                    print(f"Warning: {e}")
+        list_key = "values"
+    else:
+        list_key = None
+    
+    # Process the variables, or the values array of the Postman environment format
+    if list_key is not None:
+        variables = []
+        # Most variables carry no encoding info and are left exactly as they are
+        to_encode = []
+        for variable in insertion_point[list_key]:
+            if not isinstance(variable, dict):
+                raise TypeError(f"Insertion point {list_key} must be objects, not {type(variable).__name__}")
+            if "encoding" in variable or "encoding_iterations" in variable:
+                variable = dict(variable)
+                to_encode.append(variable)
+            variables.append(variable)
+        result[list_key] = variables
+        
+        if to_encode:
+            _encode_variables(to_encode)
     
     return result
 
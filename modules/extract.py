@@ -9,12 +9,29 @@ import os
 import json
 import re
 import logging
+import functools
 import shutil
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Dict, FrozenSet, List, Set, Tuple, Optional
+
+# Use ijson to stream large collections when only their variables are needed
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 # Configure logger
 logger = logging.getLogger('repl.extract')
 
+# Collection files at least this large are streamed rather than loaded when their data is not needed
+_STREAM_COLLECTION_THRESHOLD = 4 * 1024 * 1024
+
+# Pattern to match {{variable}}
+_VAR_PATTERN = re.compile(r'{{([^{}]+)}}')
+
+# Longest text whose variables are memoized, enough for templated URLs and headers
+_MAX_CACHED_TEXT_LENGTH = 1024
+
 def extract_variables_from_text(text: str) -> Set[str]:
     """
     Extract variables from text using regex pattern {{variable}}.
@@ -28,25 +45,145 @@ def extract_variables_from_text(text: str) -> Set[str]:
     if not text:
         return set()
     
-    # Pattern to match {{variable}}
-    pattern = r'{{([^{}]+)}}'
-    matches = re.findall(pattern, text)
+    # Only short texts are memoized, so large bodies and scripts are not kept alive by the cache
+    if len(text) > _MAX_CACHED_TEXT_LENGTH:
+        return set(_VAR_PATTERN.findall(text))
     
     # Return unique variable names
-    return set(matches)
+    return set(_extract_variables_cached(text))
+
+@functools.lru_cache(maxsize=4096)
+def _extract_variables_cached(text: str) -> FrozenSet[str]:
+    """
+    Find the variables in a text, remembering the result for repeated texts.
+    
+    Collections repeat the same templated URLs and headers across many requests.
+    
+    Args:
+        text (str): Non-empty text of at most _MAX_CACHED_TEXT_LENGTH characters
+        
+    Returns:
+        FrozenSet[str]: Set of variable names
+    """
+    return frozenset(_VAR_PATTERN.findall(text))
+
+def _find_variables(texts: List[str]) -> List[str]:
+    """
+    Find the variables in a list of texts with a single regex pass.
+    
+    Args:
+        texts (List[str]): Texts to extract variables from
+        
+    Returns:
+        List[str]: Variable names, possibly repeated
+    """
+    # Search every distinct text at once; templated URLs and headers repeat a lot.
+    # Joining with "{}" cannot create or break a match: a variable name has no braces, so
+    # no match can span a separator.
+    return _VAR_PATTERN.findall("{}".join(dict.fromkeys(text for text in texts if text)))
+
+# Kinds of JSON containers that extract_variables_from_collection reads text fields from
+(_OTHER, _TOP, _ROOT, _ITEMS, _ITEM, _REQUEST, _URL, _URL_PARTS, _HEADERS, _BODY, _FORMDATA,
+ _VALUE_HOLDER, _INFO, _VARIABLES, _VARIABLE) = range(15)
+
+# Container kind by (parent kind, key in the parent or None for array elements, is an array)
+_CONTAINER_KINDS = {
+    (_TOP, None, False): _ROOT,
+    (_ROOT, "item", True): _ITEMS,
+    (_ROOT, "info", False): _INFO,
+    (_ROOT, "variable", True): _VARIABLES,
+    (_ITEMS, None, False): _ITEM,
+    (_ITEM, "request", False): _REQUEST,
+    (_ITEM, "item", True): _ITEMS,
+    (_REQUEST, "url", False): _URL,
+    (_REQUEST, "header", True): _HEADERS,
+    (_REQUEST, "body", False): _BODY,
+    (_URL, "host", True): _URL_PARTS,
+    (_URL, "path", True): _URL_PARTS,
+    (_URL, "query", True): _URL_PARTS,
+    (_URL_PARTS, None, False): _VALUE_HOLDER,
+    (_HEADERS, None, False): _VALUE_HOLDER,
+    (_BODY, "formdata", True): _FORMDATA,
+    (_FORMDATA, None, False): _VALUE_HOLDER,
+    (_VARIABLES, None, False): _VARIABLE,
+}
+
+# Strings searched for variables, by (container kind, key or None for array elements)
+_TEXT_FIELDS = {
+    (_REQUEST, "url"),
+    (_URL, "raw"),
+    (_URL_PARTS, None),
+    (_VALUE_HOLDER, "value"),
+    (_BODY, "raw"),
+}
 
-def extract_variables_from_collection(collection_path: str) -> Tuple[Set[str], Optional[str], Dict]:
+def _stream_collection_variables(collection_path: str) -> Tuple[Set[str], Optional[str]]:
+    """
+    Extract variables and the collection ID from a Postman collection with ijson.
+    
+    Reads the same fields as extract_variables_from_collection, from parse events,
+    without building the collection in memory.
+    
+    Args:
+        collection_path (str): Path to the collection file
+        
+    Returns:
+        Tuple[Set[str], Optional[str]]: Set of variable names and collection ID
+    """
+    variables = set()
+    collection_id = None
+    texts = []
+    # [kind, current key] of each open container; array elements have no key
+    stack = [[_TOP, None]]
+    
+    with open(collection_path, 'rb') as f:
+        for event, value in ijson.basic_parse(f, use_float=True):
+            if event == 'map_key':
+                stack[-1][1] = value
+            elif event == 'end_map' or event == 'end_array':
+                stack.pop()
+            else:
+                parent, key = stack[-1]
+                if event == 'start_map' or event == 'start_array':
+                    stack.append([_CONTAINER_KINDS.get((parent, key, event == 'start_array'), _OTHER), None])
+                elif event == 'string' and (parent, key) in _TEXT_FIELDS:
+                    texts.append(value)
+                elif parent == _INFO and key == "_postman_id":
+                    collection_id = value
+                elif parent == _VARIABLE and key == "key":
+                    variables.add(value)
+    
+    variables.update(_find_variables(texts))
+    return variables, collection_id
+
+def extract_variables_from_collection(collection_path: str, load_data: bool = True) -> Tuple[Set[str], Optional[str], Dict]:
     """
     Extract variables from a Postman collection.
     
     Args:
         collection_path (str): Path to the collection file
+        load_data (bool): Whether the collection data is needed. If False, large collections
+                          are streamed with ijson (when available) and empty data is returned.
         
     Returns:
         Tuple[Set[str], Optional[str], Dict]: Set of variable names, collection ID, and collection data
     """
     logger.debug(f"Extracting variables from collection: {collection_path}")
     
+    if not load_data and IJSON_AVAILABLE:
+        try:
+            stream = os.path.getsize(collection_path) >= _STREAM_COLLECTION_THRESHOLD
+        except OSError:
+            stream = False
+        if stream:
+            try:
+                variables, collection_id = _stream_collection_variables(collection_path)
+            except Exception as e:
+                logger.error(f"Could not load collection file: {e}")
+                return set(), None, {}
+            logger.debug(f"Found {len(variables)} variables in collection")
+            return variables, collection_id, {}
+    
     # Load collection file
     try:
         with open(collection_path, 'r') as f:
@@ -63,75 +200,63 @@ def extract_variables_from_collection(collection_path: str) -> Tuple[Set[str], O
     # Initialize variables set
     variables = set()
     
-    # Process URL
-    def process_url(url):
-        if isinstance(url, str):
-            variables.update(extract_variables_from_text(url))
-        elif isinstance(url, dict):
-            for key, value in url.items():
-                if key == "raw":
-                    variables.update(extract_variables_from_text(value))
-                elif key == "host" or key == "path" or key == "query":
-                    if isinstance(value, list):
-                        for item in value:
-                            if isinstance(item, str):
-                                variables.update(extract_variables_from_text(item))
-                            elif isinstance(item, dict) and "value" in item:
-                                variables.update(extract_variables_from_text(item["value"]))
-    
-    # Process body
-    def process_body(body):
-        if not body:
-            return
-        
-        if isinstance(body, dict):
-            if "raw" in body:
-                variables.update(extract_variables_from_text(body["raw"]))
-            if "formdata" in body and isinstance(body["formdata"], list):
-                for item in body["formdata"]:
-                    if isinstance(item, dict) and "value" in item:
-                        variables.update(extract_variables_from_text(item["value"]))
-    
-    # Process headers
-    def process_headers(headers):
-        if isinstance(headers, list):
-            for header in headers:
-                if isinstance(header, dict) and "value" in header:
-                    variables.update(extract_variables_from_text(header["value"]))
-    
-    # Process request
-    def process_request(request):
-        if not request:
-            return
-        
-        if isinstance(request, dict):
-            # Process URL
-            if "url" in request:
-                process_url(request["url"])
-            
-            # Process headers
-            if "header" in request:
-                process_headers(request["header"])
+    # Text fields that may reference variables; they are searched together in one regex pass
+    texts = []
+    add_text = texts.append
+    
+    # Item lists still to visit; nested folders are pushed instead of recursed into.
+    # Parsed JSON only holds exact dicts, lists and strs, so types are checked with
+    # "type(x) is" rather than the slower isinstance.
+    stack = []
+    if "item" in collection_data and type(collection_data["item"]) is list:
+        stack.append(collection_data["item"])
+    
+    while stack:
+        for item in stack.pop():
+            # Process request if present
+            if "request" in item:
+                request = item["request"]
+                if request and type(request) is dict:
+                    # Process URL
+                    if "url" in request:
+                        url = request["url"]
+                        if type(url) is str:
+                            add_text(url)
+                        elif type(url) is dict:
+                            for key, value in url.items():
+                                if key == "raw":
+                                    add_text(value)
+                                elif (key == "host" or key == "path" or key == "query") and type(value) is list:
+                                    for part in value:
+                                        if type(part) is str:
+                                            add_text(part)
+                                        elif type(part) is dict and "value" in part:
+                                            add_text(part["value"])
+                    
+                    # Process headers
+                    if "header" in request:
+                        headers = request["header"]
+                        if type(headers) is list:
+                            for header in headers:
+                                if type(header) is dict and "value" in header:
+                                    add_text(header["value"])
+                    
+                    # Process body
+                    if "body" in request:
+                        body = request["body"]
+                        if body and type(body) is dict:
+                            if "raw" in body:
+                                add_text(body["raw"])
+                            if "formdata" in body and type(body["formdata"]) is list:
+                                for part in body["formdata"]:
+                                    if type(part) is dict and "value" in part:
+                                        add_text(part["value"])
             
-            # Process body
-            if "body" in request:
-                process_body(request["body"])
-    
-    # Process item
-    def process_item(item):
-        # Process request if present
-        if "request" in item:
-            process_request(item["request"])
-        
-        # Process nested items
-        if "item" in item and isinstance(item["item"], list):
-            for nested_item in item["item"]:
-                process_item(nested_item)
+            # Process nested items
+            if "item" in item and type(item["item"]) is list:
+                stack.append(item["item"])
     
-    # Process collection items
-    if "item" in collection_data and isinstance(collection_data["item"], list):
-        for item in collection_data["item"]:
-            process_item(item)
+    variables.update(_find_variables(texts))
     
     # Process collection variables
     if "variable" in collection_data and isinstance(collection_data["variable"], list):
@@ -156,7 +281,7 @@ def generate_variables_template(collection_path: str, output_path: str) -> bool:
     logger.debug(f"Generating variables template from {collection_path} to {output_path}")
     
     # Extract variables from collection
-    variables, collection_id, _ = extract_variables_from_collection(collection_path)
+    variables, collection_id, _ = extract_variables_from_collection(collection_path, load_data=False)
     
     if not variables:
         logger.warning("No variables found in collection")
@@ -196,7 +321,7 @@ def print_variables(collection_path: str) -> bool:
         bool: True if successful, False otherwise
     """
     # Extract variables from collection
-    variables, _, _ = extract_variables_from_collection(collection_path)
+    variables, _, _ = extract_variables_from_collection(collection_path, load_data=False)
     
     if not variables:
         logger.warning("No variables found in collection")
@@ -318,7 +443,7 @@ def create_directory_structure(collection_path: str, output_dir: str = None) ->
         process_items(collection_data["item"], base_dir)
     
     # Create variables file
-    variables, _, _ = extract_variables_from_collection(collection_path)
+    variables, _, _ = extract_variables_from_collection(collection_path, load_data=False)
     if variables:
         variables_file = os.path.join(base_dir, "variables.json")
         template = {
@@ -379,7 +504,7 @@ def extract_collection_to_structure(collection_path: str, output_dir: str = None
         print(f"Directory structure created based on collection hierarchy")
         
         # Extract variables
-        variables, _, _ = extract_variables_from_collection(collection_path)
+        variables, _, _ = extract_variables_from_collection(collection_path, load_data=False)
         if variables:
             print(f"\nFound {len(variables)} variables in collection:")
             for var in sorted(variables):
@@ -13,6 +13,9 @@ import shutil
 import time
 from typing import Dict, List, Set, Tuple, Optional
 
+# Variables are found with the extract module's cached matcher
+from modules.extract import extract_variables_from_text
+
 # Configure logger
 logger = logging.getLogger('repl.importman')
 
@@ -22,26 +25,6 @@ HOME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 CONFIG_DIR = os.path.join(HOME_DIR, "config")
 COLLECTIONS_DIR = os.path.join(HOME_DIR, "collections")
 
-def extract_variables_from_text(text: str) -> Set[str]:
-    """
-    Extract variables from text using regex pattern {{variable}}.
-    
-    Args:
-        text (str): Text to extract variables from
-        
-    Returns:
-        Set[str]: Set of variable names
-    """
-    if not text:
-        return set()
-    
-    # Pattern to match {{variable}}
-    pattern = r'{{([^{}]+)}}'
-    matches = re.findall(pattern, text)
-    
-    # Return unique variable names
-    return set(matches)
-
 def extract_variables_from_collection(collection_path: str) -> Tuple[Set[str], Optional[str], Dict]:
     """
     Extract variables from a Postman collection.
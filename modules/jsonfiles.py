@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+jsonfiles.py - JSON file helpers shared by the Repl modules
+
+This module holds the JSON parsing used for configuration and collection
+files, so every module gets the same optional orjson speedup, and the
+directory walk used to find those files.
+
+Parsed results do not depend on whether orjson is installed: documents that
+orjson would read differently from the json module (integers beyond 64 bits,
+which it reads as floats) or rejects (NaN and Infinity) are parsed with the
+json module instead.
+"""
+
+import os
+import re
+import json
+import mmap
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Iterator, List, Optional, Tuple
+
+# Use orjson for parsing JSON files when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Setup logging
+logger = logging.getLogger("repl.jsonfiles")
+
+# A run of 20 or more digits may be an integer that does not fit in 64 bits
+_LONG_DIGITS = re.compile(rb'[0-9]{20}')
+
+# Files at least this large are memory-mapped rather than read when orjson is available
+MMAP_JSON_THRESHOLD = 1024 * 1024
+
+# Parsed JSON files by (path, mtime, size), most recently used last, shared by
+# every module so a file read by one is not parsed again by another
+_JSON_CACHE_SIZE = 64
+_json_cache: "OrderedDict[Tuple[str, int, int], Any]" = OrderedDict()
+_json_cache_lock = threading.Lock()
+
+
+def json_loads(data: bytes) -> Any:
+    """
+    Parse JSON bytes, with orjson when available.
+    
+    Documents orjson cannot parse the way the json module does are parsed with
+    the json module, so the result is the same either way.
+    
+    Args:
+        data: The JSON document
+        
+    Returns:
+        Any: The parsed JSON data
+    """
+    if ORJSON_AVAILABLE and not _LONG_DIGITS.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def load_json_file(f, size: Optional[int] = None) -> Any:
+    """
+    Parse an open binary JSON file.
+    
+    With orjson, large files (typically workflow collections) are parsed straight
+    from a memory map instead of being copied into a bytes object first.
+    
+    Args:
+        f: The file, opened in binary mode
+        size: The file's size, if the caller already has it
+        
+    Returns:
+        Any: The parsed JSON data
+    """
+    if ORJSON_AVAILABLE:
+        if size is None:
+            size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_JSON_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if not _LONG_DIGITS.search(mm):
+                    try:
+                        with memoryview(mm) as view:
+                            return orjson.loads(view)
+                    except orjson.JSONDecodeError:
+                        pass
+                return json.loads(mm[:])
+    return json_loads(f.read())
+
+
+def read_json_file(file_path: str, st: Optional[os.stat_result] = None) -> Any:
+    """
+    Read and parse a JSON file, reusing the parsed contents while the file's
+    modification time and size are unchanged.
+    
+    The cached data is shared between callers, so it must not be modified.
+    
+    Args:
+        file_path: Path to the JSON file
+        st: Result of stat for the file, if the caller already has it
+        
+    Returns:
+        Any: The parsed JSON data
+    """
+    if st is None:
+        st = os.stat(file_path)
+    key = (file_path, st.st_mtime_ns, st.st_size)
+    with _json_cache_lock:
+        data = _json_cache.get(key)
+        if data is not None:
+            _json_cache.move_to_end(key)
+            return data
+    
+    with open(file_path, 'rb') as f:
+        data = load_json_file(f, st.st_size)
+    with _json_cache_lock:
+        _json_cache[key] = data
+        if len(_json_cache) > _JSON_CACHE_SIZE:
+            _json_cache.popitem(last=False)
+    return data
+
+
+def dir_mtime(dir_path: str) -> Optional[int]:
+    """Get a directory's modification time in nanoseconds, or None if it cannot be accessed."""
+    try:
+        return os.stat(dir_path).st_mtime_ns
+    except (OSError, ValueError):
+        return None
+
+
+def scan_directories(base_dir: str, follow_symlinks: bool = False,
+                     skip_hidden: bool = False) -> Iterator[Tuple[str, Optional[int], Optional[List[os.DirEntry]]]]:
+    """
+    Walk a directory tree with an explicit stack of os.scandir calls, in the same order as os.walk.
+    
+    Entry types come from the directory listing instead of a stat per entry. Like
+    os.walk, symlinked directories are not descended into, unless follow_symlinks
+    is set; even then, a link back to a directory further up the same branch is
+    not followed, since it would otherwise be listed forever.
+    
+    Args:
+        base_dir: Root directory to walk
+        follow_symlinks: Whether to descend into symlinked directories
+        skip_hidden: Whether to leave out files and directories whose names start with a dot
+        
+    Yields:
+        Tuple[str, Optional[int], Optional[List[os.DirEntry]]]: The path, modification time and
+        entries of each directory visited; entries is None if the directory could not be listed
+        or closes a symlink loop. The modification time is taken before listing, so a change made
+        while listing is seen when it is compared later.
+    """
+    # Each directory is walked along with the (st_dev, st_ino) of the directories above it
+    stack = [(base_dir, frozenset())]
+    while stack:
+        dir_path, ancestors = stack.pop()
+        try:
+            st = os.stat(dir_path)
+        except (OSError, ValueError):
+            st = None
+        
+        if st is not None and follow_symlinks:
+            dir_id = (st.st_dev, st.st_ino)
+            if dir_id in ancestors:
+                logger.debug(f"Not following symlink loop at {dir_path}")
+                yield dir_path, st.st_mtime_ns, None
+                continue
+            ancestors = ancestors | {dir_id}
+        
+        mtime = st.st_mtime_ns if st is not None else None
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.debug(f"Could not list directory {dir_path}: {e}")
+            yield dir_path, mtime, None
+            continue
+        
+        if skip_hidden:
+            entries = [entry for entry in entries if not entry.name.startswith('.')]
+        yield dir_path, mtime, entries
+        
+        subdirs = [entry.path for entry in entries
+                   if entry.is_dir() and (follow_symlinks or not entry.is_symlink())]
+        # Reversed so subdirectories are visited in listing order, as os.walk does
+        stack.extend((path, ancestors) for path in reversed(subdirs))
@@ -72,6 +72,7 @@ from modules.logman import setup_logging, get_logger, ensure_log_directory, save
 from modules.encoder import Encoder
 from modules.config import handle_list_command, handle_show_command
 from modules.collections import resolve_collection_path, select_collection_file, list_collections, extract_collection_id
+from modules.extract import extract_variables_from_text as _find_text_variables
 
 # Setup logging
 logger = setup_logging()
@@ -134,6 +135,7 @@ from modules.config import (
     load_proxy,
     save_proxy,
     check_proxy_connection,
+    check_proxy_connections,
     verify_proxy_with_request,
     select_proxy_file
 )
@@ -240,12 +242,9 @@ def extract_variables_from_text(text: str) -> Set[str]:
     Extract all variables in the format {{variable_name}} from the given text.
     Returns a set of variable names without the curly braces.
     """
-    if not text:
-        return set()
-    
-    # Match {{variable}} pattern, but not {{{variable}}} (triple braces)
-    pattern = r'{{([^{}]+)}}'
-    matches = re.findall(pattern, text)
+    # Match {{variable}} pattern, but not {{{variable}}} (triple braces), remembering
+    # the matches for texts repeated across requests
+    matches = _find_text_variables(text)
     
     # Filter out any matches that start with $ (these are usually Postman's built-in variables)
     return {match for match in matches if not match.startswith('$')}
@@ -1322,10 +1321,15 @@ class Repl:
         
         detected_proxies = []
         
+        # Probe every candidate at once; localhost first, then 127.0.0.1
+        reachable = check_proxy_connections(
+            [(host, port) for host in ("localhost", "127.0.0.1") for port in common_ports]
+        )
+        
         # Try localhost first
         host = "localhost"
         for port in common_ports:
-            if check_proxy_connection(host, port):
+            if reachable[(host, port)]:
                 logger.info(f"Found proxy at {host}:{port}")
                 # Verify proxy with a test request
                 if verify_proxy_with_request(host, port):
@@ -1335,7 +1339,7 @@ class Repl:
         # Try 127.0.0.1
         host = "127.0.0.1"
         for port in common_ports:
-            if check_proxy_connection(host, port):
+            if reachable[(host, port)]:
                 logger.info(f"Found proxy at {host}:{port}")
                 # Verify proxy with a test request
                 if verify_proxy_with_request(host, port):
@@ -1727,18 +1731,13 @@ def main():
     
     # Handle authentication options
     
-    # Initialize auth_manager
-    try:
-        from modules.auth import AuthManager
-        auth_manager = AuthManager()
-    except ImportError as e:
-        logger.warning(f"Could not import AuthManager: {e}")
-        auth_manager = None
+    # The auth module's manager is reused; profiles added, changed or removed
+    # since it was created are picked up when they are listed
     
     # Select authentication profile if requested
     if args.auth is None and auth_manager:
         # Interactive mode - prompt user to select an auth profile
-        auth_methods = auth_manager.get_auth_methods()
+        auth_methods = list(auth_manager.refresh_auth_methods())
         if auth_methods:
             print("\nAvailable authentication profiles:")
             for i, method in enumerate(auth_methods, 1):
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Tests for loading, saving and deleting authentication methods with AuthManager
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add parent directory to path to import from project root
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules import auth
+
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(data, f)
+
+
+class AuthManagerTestCase(unittest.TestCase):
+    """Run AuthManager against a temporary auth config directory."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.auth_dir = self.tmp.name
+        for name, value in (("AUTH_CONFIG_DIR", self.auth_dir),
+                            ("MIGRATION_SENTINEL_PATH", os.path.join(self.auth_dir, ".migrated_v1")),
+                            ("_AUTH_DIRS_ENSURED", False)):
+            patcher = patch.object(auth, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def write_auth(self, rel_path, label, auth_type="basic"):
+        data = {"label": label, "type": auth_type}
+        if auth_type == "basic":
+            data.update(username=label, password="secret")
+        else:
+            data["token"] = label
+        path = os.path.join(self.auth_dir, rel_path)
+        write_json(path, data)
+        return path
+
+
+class TestAuthIndex(AuthManagerTestCase):
+    """Test that auth files sharing a file name are all loaded."""
+
+    def test_same_file_name_in_type_dirs(self):
+        """Files with the same name in different type directories don't replace each other."""
+        self.write_auth("basic/shared.json", "Basic Shared")
+        self.write_auth("bearer/shared.json", "Bearer Shared", "bearer")
+
+        manager = auth.AuthManager()
+
+        self.assertEqual(set(manager.get_auth_methods()), {"Basic Shared", "Bearer Shared"})
+
+    def test_legacy_file_kept_alongside_subdir_file(self):
+        """A legacy file in the main directory is loaded even if a subdirectory file has its name."""
+        self.write_auth("basic/shared.json", "Basic Shared")
+        self.write_auth("shared.json", "Legacy Shared")
+
+        manager = auth.AuthManager()
+
+        self.assertEqual(set(manager.get_auth_methods()), {"Basic Shared", "Legacy Shared"})
+
+    def test_get_auth_method_by_label_with_shared_file_name(self):
+        """Looking a method up by label finds it whichever type directory holds its file."""
+        self.write_auth("basic/shared.json", "Shared")
+        self.write_auth("bearer/shared.json", "Shared Token", "bearer")
+
+        manager = auth.AuthManager()
+
+        self.assertEqual(manager.get_auth_method("Shared").type, "basic")
+        self.assertEqual(manager.get_auth_method("Shared Token").type, "bearer")
+
+    def test_save_and_delete_keep_other_files(self):
+        """Saving and deleting a method only touches its own file's index entry."""
+        other_path = self.write_auth("bearer/shared.json", "Bearer Token", "bearer")
+        manager = auth.AuthManager()
+
+        manager.create_basic_auth("Shared", "user", "pass")
+        saved_path = os.path.join(self.auth_dir, "basic", "shared.json")
+        self.assertTrue(os.path.isfile(saved_path))
+        self.assertIn(saved_path, manager._auth_index)
+        self.assertIn(other_path, manager._auth_index)
+
+        self.assertTrue(manager.delete_auth_method("Shared"))
+        self.assertFalse(os.path.exists(saved_path))
+        self.assertNotIn(saved_path, manager._auth_index)
+        self.assertIn(other_path, manager._auth_index)
+        self.assertIsNotNone(manager.get_auth_method("Bearer Token"))
+
+    def test_load_skips_files_deleted_after_indexing(self):
+        """Files removed after the index was built are not loaded or reported as errors."""
+        self.write_auth("basic/kept.json", "Kept")
+        removed = self.write_auth("basic/removed.json", "Removed")
+        manager = auth.AuthManager()
+        os.remove(removed)
+
+        with patch.object(auth.logger, "error") as log_error:
+            manager.load_auth_methods()
+
+        log_error.assert_not_called()
+        self.assertEqual(set(manager.auth_methods), {"Kept"})
+        self.assertNotIn(removed, manager._auth_index)
+
+    def test_load_drops_methods_of_deleted_files(self):
+        """Loading again drops the methods of files that were deleted since they were loaded."""
+        self.write_auth("basic/kept.json", "Kept")
+        removed = self.write_auth("basic/removed.json", "Removed")
+        manager = auth.AuthManager()
+        manager.load_auth_methods()
+        os.remove(removed)
+
+        manager.load_auth_methods()
+
+        self.assertEqual(set(manager.auth_methods), {"Kept"})
+        self.assertNotIn(removed, manager._file_labels)
+
+
+class TestRefreshAuthMethods(AuthManagerTestCase):
+    """Test picking up auth files changed outside the manager."""
+
+    def rewrite_auth(self, rel_path, label, auth_type="basic"):
+        path = os.path.join(self.auth_dir, rel_path)
+        mtime_ns = os.stat(path).st_mtime_ns
+        self.write_auth(rel_path, label, auth_type)
+        # Make sure the change is visible even on filesystems with coarse timestamps
+        os.utime(path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+
+    def test_relabelled_file_replaces_old_label(self):
+        """A file whose label changed is listed under its new label only."""
+        self.write_auth("basic/admin.json", "Old Label")
+        manager = auth.AuthManager()
+        self.assertEqual(set(manager.get_auth_methods()), {"Old Label"})
+
+        self.rewrite_auth("basic/admin.json", "New Label")
+
+        self.assertEqual(set(manager.refresh_auth_methods()), {"New Label"})
+
+    def test_added_and_removed_files(self):
+        """New files are loaded and methods from deleted files are dropped."""
+        removed_path = self.write_auth("basic/removed.json", "Removed")
+        manager = auth.AuthManager()
+        self.assertEqual(set(manager.get_auth_methods()), {"Removed"})
+
+        os.remove(removed_path)
+        self.write_auth("bearer/added.json", "Added", "bearer")
+
+        self.assertEqual(set(manager.refresh_auth_methods()), {"Added"})
+
+    def test_label_kept_while_another_file_holds_it(self):
+        """Removing one of two files with the same label keeps the method."""
+        removed_path = self.write_auth("basic/shared.json", "Shared")
+        self.write_auth("bearer/shared.json", "Shared", "bearer")
+        manager = auth.AuthManager()
+        manager.load_auth_methods()
+
+        os.remove(removed_path)
+
+        self.assertEqual(set(manager.refresh_auth_methods()), {"Shared"})
+
+    def test_unchanged_files_are_not_read_again(self):
+        """Refreshing without changes does not parse any file."""
+        self.write_auth("basic/admin.json", "Admin")
+        manager = auth.AuthManager()
+        manager.load_auth_methods()
+
+        with patch.object(auth, "_read_auth_file") as read_auth_file:
+            self.assertEqual(set(manager.refresh_auth_methods()), {"Admin"})
+        read_auth_file.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Tests for dynamic token and API key refreshes
+"""
+
+import os
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import patch, MagicMock
+
+# Add parent directory to path to import from project root
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules import auth
+
+
+def mock_response(body, content_type="application/json"):
+    response = MagicMock()
+    response.status_code = 200
+    response.headers = {"Content-Type": content_type, "Content-Length": str(len(body))}
+    response.content = body.encode()
+    response.text = body
+    return response
+
+
+class CookieTokenHandler(BaseHTTPRequestHandler):
+    """Token endpoint that sets a session cookie and records the cookies it receives."""
+
+    received_cookies = []
+
+    def do_GET(self):
+        self.received_cookies.append(self.headers.get("Cookie"))
+        body = b'{"access_token": "token"}'
+        self.send_response(200)
+        self.send_header("Set-Cookie", "session=user-a; Path=/")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestDynamicRefresh(unittest.TestCase):
+    """Test the requests sent to refresh dynamic tokens and API keys."""
+
+    def test_refresh_uses_current_settings(self):
+        """Settings changed after a refresh are used by the next one."""
+        token = auth.BearerToken("dynamic", is_dynamic=True, auth_url="http://auth.example/one",
+                                 auth_headers={"X-Client": "a"}, token_location="access_token")
+
+        with patch.object(auth._AUTH_SESSION, "send",
+                          return_value=mock_response('{"access_token": "t1"}')) as send:
+            token._refresh_token()
+            token.auth_url = "http://auth.example/two"
+            token.auth_headers = {"X-Client": "b"}
+            token._refresh_token()
+
+        first, second = (call.args[0] for call in send.call_args_list)
+        self.assertEqual(first.url, "http://auth.example/one")
+        self.assertEqual(second.url, "http://auth.example/two")
+        self.assertEqual(second.headers["X-Client"], "b")
+        self.assertEqual(token.token, "t1")
+
+    def test_api_key_refresh_uses_current_body(self):
+        """A changed request body is sent on the next API key refresh."""
+        key = auth.ApiKey("dynamic", is_dynamic=True, auth_url="http://auth.example/key",
+                          auth_body="one", key_location="key")
+
+        with patch.object(auth._AUTH_SESSION, "send",
+                          return_value=mock_response('{"key": "k1"}')) as send:
+            key._refresh_key()
+            key.auth_body = "two"
+            key._refresh_key()
+
+        bodies = [call.args[0].body for call in send.call_args_list]
+        self.assertEqual(bodies, ["one", "two"])
+        self.assertEqual(key.key, "k1")
+
+    def test_content_type_parameters_and_variants(self):
+        """JSON and XML responses are recognised by media type prefix, ignoring parameters."""
+        cases = [
+            ("application/json; charset=utf-8", '{"access_token": "json"}', "access_token", "json"),
+            ("application/json;charset=UTF-8", '{"access_token": "compact"}', "access_token", "compact"),
+            ("application/jsonrequest", '{"access_token": "variant"}', "access_token", "variant"),
+            ("text/xml; charset=utf-8", "<r><token>xml</token></r>", "token", "xml"),
+        ]
+        for content_type, body, location, expected in cases:
+            with self.subTest(content_type=content_type):
+                token = auth.BearerToken("dynamic", is_dynamic=True, auth_url="http://auth.example/",
+                                         token_location=location)
+                with patch.object(auth._AUTH_SESSION, "send", return_value=mock_response(body, content_type)):
+                    token._refresh_token()
+                self.assertEqual(token.token, expected)
+
+    def test_cookies_are_not_shared_between_profiles(self):
+        """Cookies set by a token endpoint are not sent on later refreshes."""
+        CookieTokenHandler.received_cookies = []
+        server = HTTPServer(("127.0.0.1", 0), CookieTokenHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        url = f"http://127.0.0.1:{server.server_port}/token"
+
+        for name in ("user-a", "user-b"):
+            token = auth.BearerToken(name, is_dynamic=True, auth_url=url, auth_method="GET",
+                                     token_location="access_token")
+            token._refresh_token()
+            self.assertEqual(token.token, "token")
+
+        self.assertEqual(CookieTokenHandler.received_cookies, [None, None])
+        self.assertEqual(len(auth._AUTH_SESSION.cookies), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests for scanning and listing the collections directory tree
+"""
+
+import io
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+# Add parent directory to path to import from project root
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules import collections as coll
+
+
+def touch(path, content="{}"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(content)
+
+
+@unittest.skipUnless(hasattr(os, "symlink"), "symlinks are not supported")
+class TestSymlinkedCollections(unittest.TestCase):
+    """Test how symlinked directories in the collections directory are handled."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.collections_dir = os.path.join(self.tmp.name, "collections")
+        shared_dir = os.path.join(self.tmp.name, "shared")
+        touch(os.path.join(self.collections_dir, "local", "local.json"))
+        touch(os.path.join(shared_dir, "shared.json"))
+        os.symlink(shared_dir, os.path.join(self.collections_dir, "linked"))
+        # A link back to a directory above it must not be followed forever
+        os.symlink(self.collections_dir, os.path.join(self.collections_dir, "local", "loop"))
+
+        patcher = patch.object(coll, "COLLECTIONS_DIR", self.collections_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        coll.invalidate_resolver_cache()
+        coll._collections_index.update(root=None, tree=None, mtimes=None, links=None)
+
+    def test_display_follows_symlinked_directories(self):
+        """The tree listing shows the contents of symlinked directories."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            coll.list_collections("tree")
+
+        self.assertIn("shared.json", output.getvalue())
+        self.assertIn("local.json", output.getvalue())
+
+    def test_symlink_loop_is_listed_once(self):
+        """A symlink back to an ancestor directory is scanned without recursing into it."""
+        tree, _, links = coll._scan_collections_tree(self.collections_dir)
+
+        loop_path = os.path.join(self.collections_dir, "local", "loop")
+        self.assertIn(loop_path, links)
+        self.assertNotIn(loop_path, tree)
+        self.assertIn(os.path.join(self.collections_dir, "linked"), tree)
+
+    def test_lookups_do_not_descend_into_symlinks(self):
+        """Like os.walk, file lookups skip symlinked directories."""
+        rel_paths = [rel_path for _, rel_path in coll._iter_collection_files()]
+
+        self.assertEqual(rel_paths, [os.path.join("local", "local.json")])
+        self.assertEqual(coll.resolve_collection_path("shared.json"), "shared.json")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests for listing and finding configuration files
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+# Add parent directory to path to import from project root
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules import auth, config
+
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(data, f)
+
+
+class TestAuthListing(unittest.TestCase):
+    """Test that only auth configurations are listed."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.auth_dir = self.tmp.name
+        write_json(os.path.join(self.auth_dir, "basic", "admin.json"),
+                   {"type": "basic", "label": "Admin", "username": "admin", "password": "secret"})
+        # State files written next to the configurations must never be listed
+        write_json(os.path.join(self.auth_dir, ".oauth2_cache.json"),
+                   {"abc": {"access_token": "cached-token", "expires_at": 9999999999}})
+        write_json(os.path.join(self.auth_dir, "basic", ".tmp-1234.json"), {"type": "basic"})
+        patcher = patch.object(config, "AUTH_DIR", self.auth_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_list_skips_hidden_files(self):
+        """Hidden files are not listed as auth configurations."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            config.list_auth_configurations()
+
+        self.assertIn("basic/admin", output.getvalue())
+        self.assertNotIn("oauth2_cache", output.getvalue())
+        self.assertNotIn(".tmp-", output.getvalue())
+
+    def test_hidden_files_cannot_be_shown(self):
+        """Hidden files are not found by name, so cached tokens are never shown."""
+        self.assertEqual(config.find_config_file("auth", ".oauth2_cache"), "")
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            config.show_auth_configuration(".oauth2_cache")
+        self.assertNotIn("cached-token", output.getvalue())
+
+    def test_show_escapes_non_ascii(self):
+        """Configurations are shown as the json module prints them."""
+        config_data = {"type": "basic", "label": "Caf\u00e9", "username": "admin", "password": "secret"}
+        write_json(os.path.join(self.auth_dir, "basic", "cafe.json"), config_data)
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            config.show_auth_configuration("cafe")
+
+        self.assertEqual(output.getvalue(), json.dumps(config_data, indent=2) + "\n")
+        self.assertIn("Caf\\u00e9", output.getvalue())
+
+    def test_token_cache_outside_config_tree(self):
+        """The OAuth2 token cache is not stored under the auth config directory."""
+        auth_config_dir = os.path.join(os.path.abspath(auth.AUTH_CONFIG_DIR), "")
+        self.assertFalse(os.path.abspath(auth.OAUTH2_TOKEN_CACHE_PATH).startswith(auth_config_dir))
+
+
+class TestTableFallback(unittest.TestCase):
+    """Test that tables are still printed when tabulate cannot be imported."""
+
+    def test_broken_tabulate_falls_back_to_simple_format(self):
+        """An installed but broken tabulate falls back to the simple table format."""
+        # A None entry in sys.modules makes the import raise ImportError
+        with patch.object(config, "TABULATE_AVAILABLE", True), \
+                patch.dict(sys.modules, {"tabulate": None}):
+            output = io.StringIO()
+            with redirect_stdout(output):
+                config.print_table(["Name", "Value"], iter([["a", 1], ["b" * 40, 2]]))
+            self.assertFalse(config.TABULATE_AVAILABLE)
+            self.assertEqual(config.format_table(["Name"], [["a"]]), "Name\n----\na")
+
+        self.assertEqual(output.getvalue().splitlines(), [
+            "Name | Value",
+            "------------",
+            "a | 1",
+            "b" * 27 + "... | 2",
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests for applying encodings to insertion point variables
+"""
+
+import os
+import sys
+import unittest
+
+# Add parent directory to path to import from project root
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.encoder import process_insertion_point
+
+
+class TestProcessInsertionPoint(unittest.TestCase):
+    """Test the process_insertion_point function."""
+
+    def test_encodes_variables_without_modifying_input(self):
+        """Variables with encoding info are encoded in a copy; others are left as they are."""
+        insertion_point = {
+            "variables": [
+                {"key": "plain", "value": "a b"},
+                {"key": "encoded", "value": "a b", "encoding": "url", "encoding_iterations": 2},
+                {"key": "base_url", "value": "http://x/ y", "encoding": "url"},
+            ]
+        }
+
+        result = process_insertion_point(insertion_point)
+
+        self.assertEqual(result["variables"], [
+            {"key": "plain", "value": "a b"},
+            {"key": "encoded", "value": "a%2520b"},
+            {"key": "base_url", "value": "http://x/ y"},
+        ])
+        self.assertEqual(insertion_point["variables"][1]["encoding"], "url")
+        self.assertEqual(insertion_point["variables"][2]["encoding"], "url")
+
+    def test_postman_environment_values(self):
+        """The values array of the Postman environment format is encoded too."""
+        result = process_insertion_point({"values": [{"key": "k", "value": "<>", "encoding": "html"}]})
+
+        self.assertEqual(result["values"], [{"key": "k", "value": "&lt;&gt;"}])
+
+    def test_variables_must_be_a_list(self):
+        """Variables given as an object are rejected rather than iterated as keys."""
+        with self.assertRaises(TypeError):
+            process_insertion_point({"variables": {"key": "value"}})
+
+    def test_variables_must_be_objects(self):
+        """Variables that are not objects are rejected."""
+        with self.assertRaises(TypeError):
+            process_insertion_point({"variables": ["key"]})
+
+
+if __name__ == "__main__":
+    unittest.main()
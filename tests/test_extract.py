@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tests for extracting variables from Postman collections
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add parent directory to path to import from project root
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules import extract
+
+COLLECTION = {
+    "info": {"_postman_id": "abc-123", "name": "Example"},
+    "item": [
+        {
+            "name": "Folder",
+            "item": [
+                {
+                    "name": "Nested",
+                    "request": {
+                        "url": {
+                            "raw": "{{base_url}}/users/{{user_id}}",
+                            "host": ["{{base_url}}"],
+                            "path": ["users", "{{user_id}}"],
+                            "query": [{"key": "q", "value": "{{query}}"}],
+                        },
+                        "header": [{"key": "Authorization", "value": "Bearer {{token}}"}],
+                        "body": {"mode": "formdata", "formdata": [{"key": "f", "value": "{{form_value}}"}]},
+                    },
+                },
+            ],
+        },
+        {
+            "name": "Plain",
+            "request": {"url": "{{base_url}}/health", "body": {"mode": "raw", "raw": "{\"a\": \"{{raw_value}}\"}"}},
+        },
+    ],
+    "variable": [{"key": "collection_var", "value": "1"}],
+}
+
+EXPECTED_VARIABLES = {"base_url", "user_id", "query", "token", "form_value", "raw_value", "collection_var"}
+
+
+class TestExtractVariablesFromCollection(unittest.TestCase):
+    """Test the extract_variables_from_collection function."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.collection_path = os.path.join(self.tmp.name, "collection.json")
+        with open(self.collection_path, 'w') as f:
+            json.dump(COLLECTION, f)
+
+    def test_load_data(self):
+        """Variables and the collection ID are found in nested requests, along with the data."""
+        variables, collection_id, data = extract.extract_variables_from_collection(self.collection_path)
+
+        self.assertEqual(variables, EXPECTED_VARIABLES)
+        self.assertEqual(collection_id, "abc-123")
+        self.assertEqual(data, COLLECTION)
+
+    def test_without_data_finds_the_same_variables(self):
+        """Skipping the data finds the same variables and collection ID."""
+        variables, collection_id, _ = extract.extract_variables_from_collection(self.collection_path,
+                                                                               load_data=False)
+
+        self.assertEqual(variables, EXPECTED_VARIABLES)
+        self.assertEqual(collection_id, "abc-123")
+
+    @unittest.skipUnless(extract.IJSON_AVAILABLE, "ijson is not installed")
+    def test_streamed_collection(self):
+        """Collections above the streaming threshold are parsed with ijson and return no data."""
+        with patch.object(extract, "_STREAM_COLLECTION_THRESHOLD", 0), \
+                patch.object(extract.json, "load", side_effect=AssertionError("collection was loaded")):
+            variables, collection_id, data = extract.extract_variables_from_collection(self.collection_path,
+                                                                                       load_data=False)
+
+        self.assertEqual(variables, EXPECTED_VARIABLES)
+        self.assertEqual(collection_id, "abc-123")
+        self.assertEqual(data, {})
+
+    def test_missing_file(self):
+        """A missing collection gives no variables, ID or data."""
+        missing = os.path.join(self.tmp.name, "missing.json")
+        for load_data in (True, False):
+            with self.subTest(load_data=load_data):
+                self.assertEqual(extract.extract_variables_from_collection(missing, load_data=load_data),
+                                 (set(), None, {}))
+
+
+class TestExtractVariablesFromText(unittest.TestCase):
+    """Test the extract_variables_from_text function."""
+
+    def setUp(self):
+        extract._extract_variables_cached.cache_clear()
+        self.addCleanup(extract._extract_variables_cached.cache_clear)
+
+    def test_short_texts_are_memoized(self):
+        """Short texts such as URLs are remembered between calls."""
+        for _ in range(2):
+            self.assertEqual(extract.extract_variables_from_text("{{base_url}}/users/{{id}}"), {"base_url", "id"})
+
+        self.assertEqual(extract._extract_variables_cached.cache_info().hits, 1)
+
+    def test_long_texts_are_not_memoized(self):
+        """Texts longer than the limit are searched directly and not kept by the cache."""
+        body = "{{payload}}" + "x" * extract._MAX_CACHED_TEXT_LENGTH
+
+        self.assertEqual(extract.extract_variables_from_text(body), {"payload"})
+        self.assertEqual(extract._extract_variables_cached.cache_info().currsize, 0)
+
+    def test_empty_text(self):
+        """Empty texts have no variables."""
+        self.assertEqual(extract.extract_variables_from_text(""), set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared JSON file helpers
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add parent directory to path to import from project root
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules import jsonfiles
+
+# Documents that orjson parses differently from the json module, or rejects
+DOCUMENTS = [
+    b'{"id": 123456789012345678901234567890}',
+    b'{"a": NaN, "b": [Infinity, -Infinity]}',
+    b'{"name": "caf\xc3\xa9", "n": 1.5}',
+]
+
+
+class TestJsonLoads(unittest.TestCase):
+    """Test that parsed results match the json module."""
+
+    def assertSameAsJson(self, result, document):
+        # NaN is not equal to itself, so the results are compared by their repr
+        self.assertEqual(repr(result), repr(json.loads(document)))
+
+    def test_json_loads(self):
+        """json_loads returns what json.loads returns."""
+        for document in DOCUMENTS:
+            with self.subTest(document=document):
+                self.assertSameAsJson(jsonfiles.json_loads(document), document)
+
+    def test_load_json_file(self):
+        """Small and memory-mapped files are parsed like json.loads."""
+        with tempfile.TemporaryDirectory() as tmp:
+            for i, document in enumerate(DOCUMENTS):
+                path = os.path.join(tmp, f"{i}.json")
+                with open(path, 'wb') as f:
+                    f.write(document)
+                for threshold in (jsonfiles.MMAP_JSON_THRESHOLD, 0):
+                    with self.subTest(document=document, threshold=threshold), \
+                            patch.object(jsonfiles, "MMAP_JSON_THRESHOLD", threshold), \
+                            open(path, 'rb') as f:
+                        self.assertSameAsJson(jsonfiles.load_json_file(f), document)
+
+    def test_invalid_json(self):
+        """Invalid documents raise ValueError."""
+        with self.assertRaises(ValueError):
+            jsonfiles.json_loads(b'{not json')
+
+
+if __name__ == "__main__":
+    unittest.main()
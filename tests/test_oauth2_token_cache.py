@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent OAuth2 token cache
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+# Add parent directory to path to import from project root
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.auth import OAuth2TokenCache
+
+
+class TestOAuth2TokenCache(unittest.TestCase):
+    """Test the OAuth2TokenCache class."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        # The cache directory does not exist until a token is stored
+        self.cache_path = os.path.join(self.tmp.name, "state", "oauth2_tokens.json")
+        self.cache = OAuth2TokenCache(self.cache_path)
+        self.key = OAuth2TokenCache.make_key("https://auth.example/token", "client",
+                                             ["read", "write"], "client_credentials")
+
+    def test_set_and_get(self):
+        """A stored token is returned and persisted for other instances."""
+        token = {"access_token": "abc", "expires_at": time.time() + 3600}
+        self.cache.set(self.key, token)
+
+        self.assertEqual(self.cache.get(self.key), token)
+        self.assertTrue(os.path.exists(self.cache_path))
+        self.assertEqual(OAuth2TokenCache(self.cache_path).get(self.key), token)
+
+    def test_expired_tokens_are_not_reused(self):
+        """Tokens that expired, or expire within the skew, are not returned."""
+        soon = {"access_token": "soon", "expires_at": time.time() + OAuth2TokenCache.EXPIRY_SKEW / 2}
+        self.cache.set(self.key, soon)
+        self.assertIsNone(self.cache.get(self.key))
+
+        other_key = OAuth2TokenCache.make_key("https://auth.example/token", "other", "", "password", "user")
+        self.cache.set(other_key, {"access_token": "old", "expires_at": time.time() - 1})
+        self.assertIsNone(self.cache.get(other_key))
+
+    def test_tokens_without_expiry_are_not_cached(self):
+        """Tokens without an expiry time are not stored."""
+        self.cache.set(self.key, {"access_token": "abc"})
+
+        self.assertIsNone(self.cache.get(self.key))
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_sees_tokens_written_by_other_instances(self):
+        """Tokens stored by another instance are picked up when the file changes."""
+        self.assertIsNone(self.cache.get(self.key))
+
+        token = {"access_token": "shared", "expires_at": time.time() + 3600}
+        OAuth2TokenCache(self.cache_path).set(self.key, token)
+
+        self.assertEqual(self.cache.get(self.key), token)
+
+    def test_unreadable_cache_is_ignored(self):
+        """A corrupt cache file is treated as empty and replaced on the next store."""
+        os.makedirs(os.path.dirname(self.cache_path))
+        with open(self.cache_path, 'w') as f:
+            f.write("not json")
+
+        self.assertIsNone(self.cache.get(self.key))
+        token = {"access_token": "abc", "expires_at": time.time() + 3600}
+        self.cache.set(self.key, token)
+        self.assertEqual(OAuth2TokenCache(self.cache_path).get(self.key), token)
+
+    def test_key_depends_on_settings(self):
+        """Keys differ by user and ignore the order of scopes."""
+        self.assertEqual(self.key, OAuth2TokenCache.make_key("https://auth.example/token", "client",
+                                                             ["write", "read"], "client_credentials"))
+        self.assertNotEqual(OAuth2TokenCache.make_key("u", "c", "s", "password", "alice"),
+                            OAuth2TokenCache.make_key("u", "c", "s", "password", "bob"))
+
+
+if __name__ == "__main__":
+    unittest.main()
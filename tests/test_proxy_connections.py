@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for checking several proxies at once
+"""
+
+import os
+import socket
+import sys
+import unittest
+
+# Add parent directory to path to import from project root
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.config import check_proxy_connections
+
+
+def closed_port():
+    """Get a local port that nothing is listening on."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestCheckProxyConnections(unittest.TestCase):
+    """Test the check_proxy_connections function."""
+
+    def setUp(self):
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.addCleanup(self.server.close)
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen(5)
+        self.open_port = self.server.getsockname()[1]
+
+    def test_reports_each_proxy(self):
+        """Listening ports are reported as running; closed ports and unknown hosts are not."""
+        proxies = [
+            ("127.0.0.1", self.open_port),
+            ("localhost", self.open_port),
+            ("127.0.0.1", closed_port()),
+            ("host.invalid", self.open_port),
+        ]
+
+        results = check_proxy_connections(proxies, timeout=2.0)
+
+        self.assertEqual(results, {
+            proxies[0]: True,
+            proxies[1]: True,
+            proxies[2]: False,
+            proxies[3]: False,
+        })
+
+    def test_invalid_ports(self):
+        """Ports that are out of range or not numbers are reported as not running."""
+        proxies = [("127.0.0.1", 70000), ("127.0.0.1", str(self.open_port)), ("127.0.0.1", self.open_port)]
+
+        results = check_proxy_connections(proxies, timeout=2.0)
+
+        self.assertEqual(results, {proxies[0]: False, proxies[1]: False, proxies[2]: True})
+
+    def test_no_proxies(self):
+        """Checking no proxies returns an empty result."""
+        self.assertEqual(check_proxy_connections([]), {})
+
+
+if __name__ == "__main__":
+    unittest.main()